@@ -10,7 +10,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class IndexRule:
     """DataFrame Index定義"""
 
@@ -23,7 +23,7 @@ class IndexRule:
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class MultiIndexLevel:
     """MultiIndex レベル定義"""
 
@@ -33,7 +33,7 @@ class MultiIndexLevel:
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ColumnRule:
     """DataFrame Column定義"""
 
@@ -46,7 +46,7 @@ class ColumnRule:
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class FrameSpec:
     """DataFrame制約定義
 
@@ -81,7 +81,7 @@ class FrameSpec:
     examples: list[dict[str, Any]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class EnumMemberSpec:
     """Enumメンバー定義"""
 
@@ -90,7 +90,7 @@ class EnumMemberSpec:
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class EnumSpec:
     """Enum定義（メタデータ付き）
 
@@ -111,7 +111,7 @@ class EnumSpec:
     check_functions: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ParameterSpec:
     """関数パラメータ定義"""
 
@@ -122,7 +122,7 @@ class ParameterSpec:
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class SpecMetadata:
     """実装者向けメタデータ
 
@@ -138,7 +138,7 @@ class SpecMetadata:
     explicit_checks: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class TransformSpec:
     """Transform定義
 
@@ -163,7 +163,7 @@ class TransformSpec:
     spec_metadata: SpecMetadata | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DAGStageSpec:
     """DAG Stage定義
 
@@ -192,7 +192,7 @@ class DAGStageSpec:
     collect_output: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckSpec:
     """Check関数定義
 
@@ -213,7 +213,7 @@ class CheckSpec:
     spec_metadata: SpecMetadata | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ExampleCase:
     """検証用入力・期待値定義"""
 
@@ -225,7 +225,7 @@ class ExampleCase:
     expected: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class GeneratorDef:
     """データ生成関数定義
 
@@ -248,7 +248,7 @@ class GeneratorDef:
     spec_metadata: SpecMetadata | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PydanticModelSpec:
     """Pydanticモデル定義
 
@@ -269,7 +269,7 @@ class PydanticModelSpec:
     check_functions: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class TypeAliasSpec:
     """型エイリアス定義"""
 
@@ -280,7 +280,7 @@ class TypeAliasSpec:
     check_functions: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class GenericSpec:
     """Generic型定義"""
 
@@ -295,7 +295,7 @@ class GenericSpec:
     check_functions: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class MetaSpec:
     """メタデータ"""
 
@@ -304,7 +304,7 @@ class MetaSpec:
     version: str = "1.0"
 
 
-@dataclass
+@dataclass(slots=True)
 class SpecIR:
     """統合IR（中間表現）
 
@@ -1,5 +1,5 @@
 """spectool.core.engine: Spec→IR変換エンジン"""
 
-from .loader import load_spec
+from .loader import load_spec, load_spec_from_str
 
-__all__ = ["load_spec"]
+__all__ = ["load_spec", "load_spec_from_str"]
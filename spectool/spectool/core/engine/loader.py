@@ -8,9 +8,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any
-
-import yaml
+from typing import Any, TextIO
 
 from spectool.spectool.core.base.ir import (
     CheckSpec,
@@ -49,12 +47,39 @@ def load_spec(spec_path: str | Path) -> SpecIR:
     spec_path = Path(spec_path)
     with open(spec_path) as f:
         if spec_path.suffix in {".yaml", ".yml"}:
-            data = yaml.safe_load(f)
-        elif spec_path.suffix == ".json":
-            data = json.load(f)
-        else:
-            raise ValueError(f"未対応のファイル形式: {spec_path.suffix}")
+            # YAMLは文字列からの読み込みと同じ経路でIRにする
+            return load_spec_from_str(f.read())
+        if spec_path.suffix == ".json":
+            return _build_spec_ir(json.load(f))
+    raise ValueError(f"未対応のファイル形式: {spec_path.suffix}")
+
+
+def load_spec_from_str(content: str) -> SpecIR:
+    """YAML/JSON文字列の仕様をIRに変換（ファイルを経由しない）
+
+    Args:
+        content: 仕様のYAML文字列（JSONはYAMLのサブセットとして読み込める）
+
+    Returns:
+        SpecIR: 統合IR
+    """
+    return _build_spec_ir(_load_yaml(content))
+
+
+def _load_yaml(stream: str | TextIO) -> dict[str, Any]:
+    """YAMLをSafeLoaderでパースする（libyamlが利用可能ならCローダーを使う）
+
+    PyYAMLのimportは最初のパースまで遅らせる（IRを直接組み立てるだけの利用側はimportコストを払わない）。
+    """
+    import yaml
+
+    # CSafeLoader は libyaml 付きでビルドされた場合のみ定義される（純Python実装より大幅に速い）
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(stream, Loader=loader)  # noqa: S506
+
 
+def _build_spec_ir(data: dict[str, Any]) -> SpecIR:
+    """読み込み済みの仕様辞書をIRに変換"""
     # メタデータ
     meta = _load_meta(data.get("meta", {}), data.get("version", "1.0"))
 
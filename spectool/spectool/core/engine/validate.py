@@ -9,9 +9,9 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+from spectool.spectool.core.base.ir import SpecIR
 from spectool.spectool.core.engine.loader import load_spec
 from spectool.spectool.core.engine.validate_edge_cases import (
-    validate_datatype_checks,
     validate_datatype_examples_generators,
     validate_edge_cases_errors_only,
 )
@@ -42,8 +42,27 @@ def validate_spec(
         各層はカテゴリ別のメッセージリスト
     """
     spec_path = Path(spec_path)
-    ir = load_spec(spec_path)
+    # project_root は spec_path の親ディレクトリと仮定
+    return validate_spec_ir(load_spec(spec_path), spec_path.parent.resolve(), skip_impl_check, normalize)
+
+
+def validate_spec_ir(
+    ir: SpecIR,
+    project_root: Path | None = None,
+    skip_impl_check: bool = False,
+    normalize: bool = False,
+) -> dict[str, dict[str, list[str]]]:
+    """読み込み済みIRを検証し、エラー/警告/成功をカテゴリ別に返す
 
+    Args:
+        ir: 検証対象のIR
+        project_root: 実装ファイルのimport基準ディレクトリ（Noneならsys.pathを変更しない）
+        skip_impl_check: 実装ファイルのインポートチェックをスキップ
+        normalize: IRを正規化してから検証（Pydanticモデルから列を推論）
+
+    Returns:
+        validate_spec と同じ3層構造の辞書
+    """
     # 正規化オプション
     if normalize:
         from spectool.spectool.core.engine.normalizer import normalize_ir
@@ -51,11 +70,10 @@ def validate_spec(
         ir = normalize_ir(ir)
 
     # sys.pathにproject_rootを追加（apps.XXX形式のimportのため）
-    # project_root は spec_path の親ディレクトリと仮定
-    project_root = spec_path.parent.resolve()
-    project_root_str = str(project_root)
-    if project_root_str not in sys.path:
-        sys.path.insert(0, project_root_str)
+    if project_root is not None:
+        project_root_str = str(project_root)
+        if project_root_str not in sys.path:
+            sys.path.insert(0, project_root_str)
 
     # カテゴリ別辞書を作成
     errors = create_category_dict()
@@ -77,9 +95,7 @@ def validate_spec(
     example_data_errors = validate_example_data(ir)
     errors["examples"].extend(example_data_errors)
 
-    # 警告を生成
-    datatype_check_warnings = validate_datatype_checks(ir)
-    warnings["datatypes"].extend(datatype_check_warnings)
+    # check_functionsは0個以上許容するため、DataTypeのcheck関数の有無では警告を出さない
 
     # ExampleまたはGeneratorが存在しないdatatypeをエラーとして扱う
     datatype_example_errors = validate_datatype_examples_generators(ir)
@@ -92,4 +108,9 @@ def validate_spec(
 
 
 # Re-export format_validation_result for convenience
-__all__ = ["validate_spec", "validate_ir", "format_validation_result"]
+__all__ = [
+    "validate_spec",
+    "validate_spec_ir",
+    "validate_ir",
+    "format_validation_result",
+]
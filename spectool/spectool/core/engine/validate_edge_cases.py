@@ -5,7 +5,7 @@
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Iterator
 
 from spectool.spectool.core.base.ir import (
     EnumSpec,
@@ -49,25 +49,23 @@ def validate_edge_cases_errors_only(ir: SpecIR) -> list[str]:
     return errors
 
 
-def _find_matching_transforms(ir: SpecIR, input_type: str, output_type: str) -> list[str]:
-    """指定された入出力型に一致するtransform関数を探す
+def _index_transforms_by_signature(ir: SpecIR) -> dict[tuple[str, str], list[str]]:
+    """transform関数を (第1パラメータの型, return_type_ref) ごとにまとめる
+
+    stageごとにtransform全体を走査せず、入出力型の組で候補を引けるようにする。
 
     Args:
         ir: SpecIR
-        input_type: 入力型
-        output_type: 出力型
 
     Returns:
-        一致するtransform IDのリスト
+        (入力型, 出力型) → 一致するtransform IDのリスト
     """
-    matching_transforms = []
+    index: dict[tuple[str, str], list[str]] = {}
     for transform in ir.transforms:
-        # 第1パラメータの型がinput_typeで、return_type_refがoutput_typeのものを探す
-        if transform.parameters and transform.return_type_ref == output_type:
-            first_param = transform.parameters[0]
-            if first_param.type_ref == input_type:
-                matching_transforms.append(transform.id)
-    return matching_transforms
+        if transform.parameters and transform.return_type_ref:
+            key = (transform.parameters[0].type_ref, transform.return_type_ref)
+            index.setdefault(key, []).append(transform.id)
+    return index
 
 
 def _validate_dag_stage_candidates(ir: SpecIR, all_datatype_ids: set[str]) -> list[str]:
@@ -81,13 +79,14 @@ def _validate_dag_stage_candidates(ir: SpecIR, all_datatype_ids: set[str]) -> li
         エラーメッセージのリスト
     """
     errors: list[str] = []
+    transforms_by_signature = _index_transforms_by_signature(ir)
 
     for stage in ir.dag_stages:
         # 候補が空の場合
         if not stage.candidates:
             # 自動収集を試みる（input_type → output_type の変換を行うtransformを探す）
             if stage.input_type and stage.output_type:
-                matching_transforms = _find_matching_transforms(ir, stage.input_type, stage.output_type)
+                matching_transforms = transforms_by_signature.get((stage.input_type, stage.output_type))
 
                 if not matching_transforms:
                     errors.append(
@@ -104,133 +103,55 @@ def _validate_dag_stage_candidates(ir: SpecIR, all_datatype_ids: set[str]) -> li
     return errors
 
 
-def _check_datatype_has_check_functions(datatype: Any) -> str | None:  # noqa: ANN401
-    """データタイプにcheck関数が定義されているかチェック
+def _iter_datatypes(ir: SpecIR) -> Iterator[FrameSpec | EnumSpec | PydanticModelSpec | TypeAliasSpec | GenericSpec]:
+    """全種類のデータタイプを順に返す（リストを組み立てない）"""
+    yield from ir.frames
+    yield from ir.enums
+    yield from ir.pydantic_models
+    yield from ir.type_aliases
+    yield from ir.generics
 
-    Args:
-        datatype: データタイプ（Frame/Enum/PydanticModel/TypeAlias/Generic）
+
+def _collect_referenced_datatypes(ir: SpecIR) -> tuple[set[str], set[str]]:
+    """トップレベルのexamples/generatorsから参照されているデータタイプIDを収集
 
     Returns:
-        警告メッセージ、または None
+        (exampleのdatatype_ref, generatorのreturn_type_ref)
     """
-    # check_functionsは0個以上許容するため、警告を出さない
-    return None
+    example_refs = {ex.datatype_ref for ex in ir.examples if ex.datatype_ref and ex.datatype_ref.strip()}
+    generator_refs = {
+        gen.return_type_ref for gen in ir.generators if gen.return_type_ref and gen.return_type_ref.strip()
+    }
+    return example_refs, generator_refs
 
 
-def validate_datatype_checks(ir: SpecIR) -> list[str]:
-    """DataTypeのcheck関数の存在をチェック（現在は警告を出さない）
+def validate_datatype_examples_generators(ir: SpecIR) -> list[str]:
+    """DataTypeのexample/generatorの両方がゼロ件でないかチェック
 
-    check_functionsは0個以上許容するため、現在は警告を生成しない。
+    トップレベルの参照を先に集めておき、データタイプは1回の走査で判定する。
+    datatypeレベルのexamples（正規化後）とFrameSpecのgenerator_factoryも考慮する。
 
     Args:
         ir: 検証対象のIR
 
     Returns:
-        警告メッセージのリスト（空リスト）
-    """
-    warnings: list[str] = []
-
-    # 全てのデータタイプをまとめてチェック
-    all_datatypes = [
-        *ir.frames,
-        *ir.enums,
-        *ir.pydantic_models,
-        *ir.type_aliases,
-        *ir.generics,
-    ]
-
-    for datatype in all_datatypes:
-        warning = _check_datatype_has_check_functions(datatype)
-        if warning:
-            warnings.append(warning)
-
-    return warnings
-
-
-def _collect_example_datatypes(ir: SpecIR) -> set[str]:
-    """Exampleから参照されているdatatype_refを収集
-
-    トップレベルのexamplesとdatatypeレベルのexamplesの両方を確認する。
+        メッセージのリスト
     """
-    example_datatypes = set()
-
-    # トップレベルのexamplesから収集
-    for example in ir.examples:
-        if example.datatype_ref and example.datatype_ref.strip():
-            example_datatypes.add(example.datatype_ref)
-
-    # datatypeレベルのexamplesから収集（正規化後）
-    all_datatypes: list[FrameSpec | EnumSpec | PydanticModelSpec | TypeAliasSpec | GenericSpec] = [
-        *ir.frames,
-        *ir.enums,
-        *ir.pydantic_models,
-        *ir.type_aliases,
-        *ir.generics,
-    ]
-
-    for datatype in all_datatypes:
-        if datatype.examples:
-            example_datatypes.add(datatype.id)
-
-    return example_datatypes
+    messages: list[str] = []
+    example_refs, generator_refs = _collect_referenced_datatypes(ir)
 
-
-def _collect_generator_datatypes(ir: SpecIR) -> set[str]:
-    """Generatorとgenerator_factoryから参照されているデータタイプを収集"""
-    generator_datatypes = set()
-    for generator in ir.generators:
-        if generator.return_type_ref and generator.return_type_ref.strip():
-            generator_datatypes.add(generator.return_type_ref)
-
-    # FrameSpecのgenerator_factoryもチェック
-    for frame in ir.frames:
-        if frame.generator_factory:
-            generator_datatypes.add(frame.id)
-
-    return generator_datatypes
-
-
-def _check_datatype_has_examples_or_generators(
-    datatype_id: str, example_datatypes: set[str], generator_datatypes: set[str]
-) -> str | None:
-    """データタイプにexampleまたはgeneratorが存在するかチェック"""
-    if datatype_id not in example_datatypes and datatype_id not in generator_datatypes:
-        return (
-            f"DataType '{datatype_id}': neither examples nor generators are defined. "
-            f"Consider adding examples or a generator for testing."
+    for datatype in _iter_datatypes(ir):
+        has_example = bool(datatype.examples) or datatype.id in example_refs
+        has_generator = datatype.id in generator_refs or (
+            isinstance(datatype, FrameSpec) and bool(datatype.generator_factory)
         )
-    return None
-
-
-def validate_datatype_examples_generators(ir: SpecIR) -> list[str]:
-    """DataTypeのexample/generatorの両方がゼロ件でないかチェック（警告）
-
-    Args:
-        ir: 検証対象のIR
+        if not has_example and not has_generator:
+            messages.append(
+                f"DataType '{datatype.id}': neither examples nor generators are defined. "
+                f"Consider adding examples or a generator for testing."
+            )
 
-    Returns:
-        警告メッセージのリスト
-    """
-    warnings: list[str] = []
-
-    example_datatypes = _collect_example_datatypes(ir)
-    generator_datatypes = _collect_generator_datatypes(ir)
-
-    # 各DataTypeでexampleもgeneratorも存在しないものを警告
-    all_datatypes: list[FrameSpec | EnumSpec | PydanticModelSpec | TypeAliasSpec | GenericSpec] = [
-        *ir.frames,
-        *ir.enums,
-        *ir.pydantic_models,
-        *ir.type_aliases,
-        *ir.generics,
-    ]
-
-    for datatype in all_datatypes:
-        warning = _check_datatype_has_examples_or_generators(datatype.id, example_datatypes, generator_datatypes)
-        if warning:
-            warnings.append(warning)
-
-    return warnings
+    return messages
 
 
 def _validate_example_refs(ir: SpecIR, all_datatype_ids: set[str]) -> list[str]:
@@ -10,7 +10,10 @@ IRの意味論チェックを行う。
 
 from __future__ import annotations
 
+import functools
 import importlib
+from collections import Counter
+from types import ModuleType
 
 from spectool.spectool.core.base.ir import FrameSpec, SpecIR
 
@@ -98,11 +101,12 @@ _VALID_DTYPES = {
     "category",
 }
 
+_VALID_SELECTION_MODES = {"single", "exclusive", "multiple"}
+
 
 def _validate_column_duplicates(frame: FrameSpec) -> list[str]:
     """重複列名をチェック"""
-    col_names = [col.name for col in frame.columns]
-    duplicates = {name for name in col_names if col_names.count(name) > 1}
+    duplicates = {name for name, count in Counter(col.name for col in frame.columns).items() if count > 1}
     if duplicates:
         return [f"DataFrame '{frame.id}': duplicate column names: {duplicates}"]
     return []
@@ -177,6 +181,14 @@ def _validate_dataframe_specs(ir: SpecIR) -> list[str]:
     return errors
 
 
+def _is_malformed_impl(impl: str) -> bool:
+    """impl参照が 'module:function' 形式でないか（未設定・空白のみは対象外）
+
+    正規表現は使わず文字列演算だけで判定する（transform/checkごとに呼ばれるため）。
+    """
+    return bool(impl) and not impl.isspace() and ":" not in impl
+
+
 def _validate_check_specs(ir: SpecIR) -> list[str]:
     """Check定義の妥当性チェック
 
@@ -193,7 +205,7 @@ def _validate_check_specs(ir: SpecIR) -> list[str]:
 
     for check in ir.checks:
         # impl形式チェック
-        if check.impl and check.impl.strip() != "" and ":" not in check.impl:
+        if _is_malformed_impl(check.impl):
             errors.append(f"Check '{check.id}': impl must be in 'module:function' format, got '{check.impl}'")
 
     return errors
@@ -254,7 +266,7 @@ def _validate_transform_specs(ir: SpecIR) -> list[str]:
             errors.append(f"Transform '{transform.id}': invalid return_type_ref '{transform.return_type_ref}'")
 
         # impl形式チェック
-        if transform.impl and transform.impl.strip() != "" and ":" not in transform.impl:
+        if _is_malformed_impl(transform.impl):
             errors.append(
                 f"Transform '{transform.id}': impl must be in 'module:function' format, got '{transform.impl}'"
             )
@@ -294,11 +306,10 @@ def _validate_dag_stage_specs(ir: SpecIR) -> list[str]:
             )
 
         # selection_modeの妥当性
-        valid_modes = {"single", "exclusive", "multiple"}
-        if stage.selection_mode not in valid_modes:
+        if stage.selection_mode not in _VALID_SELECTION_MODES:
             errors.append(
                 f"DAG Stage '{stage.stage_id}': invalid selection_mode '{stage.selection_mode}', "
-                f"must be one of {valid_modes}"
+                f"must be one of {_VALID_SELECTION_MODES}"
             )
 
     return errors
@@ -386,6 +397,9 @@ def _validate_type_references(ir: SpecIR, skip_impl_check: bool = False) -> list
     if skip_impl_check:
         return []
 
+    # インポート結果のキャッシュは1回の検証内だけで使う（前回以降に生成されたモジュールを取りこぼさない）
+    _try_import.cache_clear()
+
     errors: list[str] = []
 
     # 各型の検証を実行
@@ -459,10 +473,18 @@ def _can_import_python_ref(ref: str, ir: SpecIR | None = None) -> bool:
     if ir is not None:
         resolved_ref = _resolve_impl_path(ref, ir)
 
+    module_path, name = resolved_ref.rsplit(":", 1)
+    module = _try_import(module_path)
+    return module is not None and hasattr(module, name)
+
+
+@functools.lru_cache(maxsize=256)
+def _try_import(module_path: str) -> ModuleType | None:
+    """モジュールをインポートする（失敗時はNone）
+
+    同じモジュールを参照する定義が多いspecで、インポート失敗時の探索を繰り返さないようキャッシュする。
+    """
     try:
-        module_path, name = resolved_ref.rsplit(":", 1)
-        module = importlib.import_module(module_path)
-        getattr(module, name)
-        return True
-    except (ImportError, AttributeError):
-        return False
+        return importlib.import_module(module_path)
+    except ImportError:
+        return None
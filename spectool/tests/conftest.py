@@ -0,0 +1,62 @@
+"""spectoolテスト共通のフィクスチャ"""
+
+import copy
+import hashlib
+import json
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from spectool.spectool.core.base.ir import SpecIR
+from spectool.spectool.core.engine.loader import load_spec, load_spec_from_str
+from spectool.spectool.core.engine.normalizer import normalize_ir
+from spectool.spectool.core.engine.validate import validate_spec_ir
+
+
+def _spec_text(spec_data: dict | str) -> str:
+    """specをテキスト化する（文字列は組み立て済みのYAMLとしてそのまま返す）
+
+    辞書はキー順を揃えたJSONにする（JSONはYAMLとしてそのまま読めるため、ローダー側の変更は不要で、
+    YAMLのダンプよりも速い）。指数表記のfloatなどYAML 1.1と解釈がずれる値は含めないこと。
+    """
+    return spec_data if isinstance(spec_data, str) else json.dumps(spec_data, sort_keys=True)
+
+
+@pytest.fixture(scope="session")
+def cached_validate_spec() -> Callable[[dict | str], dict[str, dict[str, list[str]]]]:
+    """specを検証し、結果をセッション内でキャッシュする関数を返す
+
+    specはファイルに書き出さず、テキスト（辞書はJSON化したもの）から読み込んだIRを
+    validate_spec_ir で直接検証する。キーはspecテキストのblake2b。
+    呼び出し側での変更がキャッシュに波及しないよう、結果はコピーして返す。
+    """
+    cache: dict[bytes, dict[str, dict[str, list[str]]]] = {}
+
+    def validate(spec_data: dict | str) -> dict[str, dict[str, list[str]]]:
+        content = _spec_text(spec_data)
+        key = hashlib.blake2b(content.encode(), digest_size=16).digest()
+        if key not in cache:
+            cache[key] = validate_spec_ir(load_spec_from_str(content))
+        return copy.deepcopy(cache[key])
+
+    return validate
+
+
+@pytest.fixture(scope="session")
+def load_fixture_ir() -> Callable[..., SpecIR]:
+    """fixtureのspecを読み込み（必要なら正規化し）、結果をセッション内でキャッシュする関数を返す
+
+    キーは (パス, 更新時刻, 正規化の有無)。テスト側でIRを書き換えてもキャッシュに
+    波及しないよう、IRはコピーして返す。
+    """
+    cache: dict[tuple[Path, int, bool], SpecIR] = {}
+
+    def load(spec_path: Path, normalize: bool = False) -> SpecIR:
+        key = (spec_path, spec_path.stat().st_mtime_ns, normalize)
+        if key not in cache:
+            ir = load_spec(spec_path)
+            cache[key] = normalize_ir(ir) if normalize else ir
+        return copy.deepcopy(cache[key])
+
+    return load
@@ -1,7 +1,5 @@
 """TypeAlias生成バックエンドのテスト"""
 
-from pathlib import Path
-import tempfile
 import pytest
 
 from spectool.spectool.core.base.ir import (
@@ -22,7 +20,7 @@ from spectool.tests.test_helpers import (
 )
 
 
-def test_generate_dataframe_aliases_basic():
+def test_generate_dataframe_aliases_basic(tmp_path):
     """基本的なDataFrame TypeAliasが生成できること"""
     frame = FrameSpec(
         id="TestFrame",
@@ -39,20 +37,19 @@ def test_generate_dataframe_aliases_basic():
         frames=[frame],
     )
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_path = Path(tmpdir) / "type_aliases.py"
-        generate_dataframe_aliases(ir, output_path)
+    output_path = tmp_path / "type_aliases.py"
+    generate_dataframe_aliases(ir, output_path)
 
-        assert output_path.exists()
-        content = output_path.read_text()
+    assert output_path.exists()
+    content = output_path.read_text()
 
-        # 基本的な構造の確認
-        assert "TestFrame: TypeAlias" in content
-        assert "pd.DataFrame" in content
-        assert "from typing import TypeAlias" in content
+    # 基本的な構造の確認
+    assert "TestFrame: TypeAlias" in content
+    assert "pd.DataFrame" in content
+    assert "from typing import TypeAlias" in content
 
 
-def test_generate_dataframe_aliases_with_metadata():
+def test_generate_dataframe_aliases_with_metadata(tmp_path):
     """メタデータ付きDataFrame TypeAliasが生成できること"""
     frame = FrameSpec(
         id="OHLCVFrame",
@@ -72,22 +69,21 @@ def test_generate_dataframe_aliases_with_metadata():
         frames=[frame],
     )
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_path = Path(tmpdir) / "type_aliases.py"
-        generate_dataframe_aliases(ir, output_path)
+    output_path = tmp_path / "type_aliases.py"
+    generate_dataframe_aliases(ir, output_path)
 
-        assert output_path.exists()
-        content = output_path.read_text()
+    assert output_path.exists()
+    content = output_path.read_text()
 
-        # メタデータの確認
-        assert "PydanticRowRef" in content
-        assert "GeneratorSpec" in content
-        assert "CheckedSpec" in content
-        assert "OHLCVRowModel" in content
-        assert "apps.generators:generate_ohlcv" in content
+    # メタデータの確認
+    assert "PydanticRowRef" in content
+    assert "GeneratorSpec" in content
+    assert "CheckedSpec" in content
+    assert "OHLCVRowModel" in content
+    assert "apps.generators:generate_ohlcv" in content
 
 
-def test_generate_enum_aliases_basic():
+def test_generate_enum_aliases_basic(tmp_path):
     """基本的なEnum TypeAliasが生成できること"""
     enum = EnumSpec(
         id="AssetClass",
@@ -104,19 +100,18 @@ def test_generate_enum_aliases_basic():
         enums=[enum],
     )
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_path = Path(tmpdir) / "enum_aliases.py"
-        generate_enum_aliases(ir, output_path)
+    output_path = tmp_path / "enum_aliases.py"
+    generate_enum_aliases(ir, output_path)
 
-        assert output_path.exists()
-        content = output_path.read_text()
+    assert output_path.exists()
+    content = output_path.read_text()
 
-        # 基本的な構造の確認
-        assert "AssetClassType: TypeAlias" in content
-        assert "from apps.test_project.models.enums import AssetClass" in content
+    # 基本的な構造の確認
+    assert "AssetClassType: TypeAlias" in content
+    assert "from apps.test_project.models.enums import AssetClass" in content
 
 
-def test_generate_enum_aliases_with_examples():
+def test_generate_enum_aliases_with_examples(tmp_path):
     """例示データ付きEnum TypeAliasが生成できること"""
     enum = EnumSpec(
         id="Status",
@@ -135,19 +130,18 @@ def test_generate_enum_aliases_with_examples():
         enums=[enum],
     )
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_path = Path(tmpdir) / "enum_aliases.py"
-        generate_enum_aliases(ir, output_path)
+    output_path = tmp_path / "enum_aliases.py"
+    generate_enum_aliases(ir, output_path)
 
-        assert output_path.exists()
-        content = output_path.read_text()
+    assert output_path.exists()
+    content = output_path.read_text()
 
-        # メタデータの確認
-        assert "ExampleSpec" in content
-        assert "CheckedSpec" in content
+    # メタデータの確認
+    assert "ExampleSpec" in content
+    assert "CheckedSpec" in content
 
 
-def test_generate_pydantic_aliases_basic():
+def test_generate_pydantic_aliases_basic(tmp_path):
     """基本的なPydanticモデル TypeAliasが生成できること"""
     model = PydanticModelSpec(
         id="UserConfig",
@@ -163,19 +157,18 @@ def test_generate_pydantic_aliases_basic():
         pydantic_models=[model],
     )
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_path = Path(tmpdir) / "pydantic_aliases.py"
-        generate_pydantic_aliases(ir, output_path)
+    output_path = tmp_path / "pydantic_aliases.py"
+    generate_pydantic_aliases(ir, output_path)
 
-        assert output_path.exists()
-        content = output_path.read_text()
+    assert output_path.exists()
+    content = output_path.read_text()
 
-        # 基本的な構造の確認
-        assert "UserConfigType: TypeAlias" in content
-        assert "from apps.test_project.models.models import UserConfig" in content
+    # 基本的な構造の確認
+    assert "UserConfigType: TypeAlias" in content
+    assert "from apps.test_project.models.models import UserConfig" in content
 
 
-def test_generate_all_type_aliases():
+def test_generate_all_type_aliases(tmp_path):
     """全てのTypeAliasが1ファイルに統合生成できること"""
     frame = FrameSpec(
         id="TestFrame",
@@ -202,32 +195,30 @@ def test_generate_all_type_aliases():
         pydantic_models=[model],
     )
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_path = Path(tmpdir) / "type_aliases.py"
-        generate_all_type_aliases(ir, output_path)
+    output_path = tmp_path / "type_aliases.py"
+    generate_all_type_aliases(ir, output_path)
 
-        assert output_path.exists()
-        content = output_path.read_text()
+    assert output_path.exists()
+    content = output_path.read_text()
 
-        # 全ての型が含まれていることを確認
-        assert "TestFrame:" in content
-        assert "StatusType:" in content
-        assert "ConfigType:" in content
-        assert "# === Pydantic Model TypeAliases ===" in content
-        assert "# === Enum TypeAliases ===" in content
-        assert "# === DataFrame TypeAliases ===" in content
+    # 全ての型が含まれていることを確認
+    assert "TestFrame:" in content
+    assert "StatusType:" in content
+    assert "ConfigType:" in content
+    assert "# === Pydantic Model TypeAliases ===" in content
+    assert "# === Enum TypeAliases ===" in content
+    assert "# === DataFrame TypeAliases ===" in content
 
 
-def test_generate_dataframe_aliases_empty():
+def test_generate_dataframe_aliases_empty(tmp_path):
     """DataFrameが空の場合、生成をスキップすること"""
     ir = SpecIR(
         meta=MetaSpec(name="test-project"),
         frames=[],
     )
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_path = Path(tmpdir) / "type_aliases.py"
-        generate_dataframe_aliases(ir, output_path)
+    output_path = tmp_path / "type_aliases.py"
+    generate_dataframe_aliases(ir, output_path)
 
-        # ファイルは生成されない
-        assert not output_path.exists()
+    # ファイルは生成されない
+    assert not output_path.exists()
@@ -1,7 +1,5 @@
 """Pandera Schema生成バックエンドのテスト"""
 
-from pathlib import Path
-import tempfile
 import pytest
 
 from spectool.spectool.core.base.ir import (
@@ -15,7 +13,7 @@ from spectool.spectool.core.base.ir import (
 from spectool.spectool.backends.py_validators import generate_pandera_schemas
 
 
-def test_generate_pandera_schemas_basic():
+def test_generate_pandera_schemas_basic(tmp_path):
     """基本的なPandera Schemaが生成できること"""
     frame = FrameSpec(
         id="TestFrame",
@@ -32,22 +30,21 @@ def test_generate_pandera_schemas_basic():
         frames=[frame],
     )
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_path = Path(tmpdir) / "schemas.py"
-        generate_pandera_schemas(ir, output_path)
+    output_path = tmp_path / "schemas.py"
+    generate_pandera_schemas(ir, output_path)
 
-        assert output_path.exists()
-        content = output_path.read_text()
+    assert output_path.exists()
+    content = output_path.read_text()
 
-        # 基本的な構造の確認
-        assert "class TestFrameSchema(pa.DataFrameModel):" in content
-        assert "import pandera.pandas as pa" in content
-        assert "idx: Index[int]" in content
-        assert "col1: Series[float]" in content
-        assert "col2: Series[str]" in content
+    # 基本的な構造の確認
+    assert "class TestFrameSchema(pa.DataFrameModel):" in content
+    assert "import pandera.pandas as pa" in content
+    assert "idx: Index[int]" in content
+    assert "col1: Series[float]" in content
+    assert "col2: Series[str]" in content
 
 
-def test_generate_pandera_schemas_with_datetime_index():
+def test_generate_pandera_schemas_with_datetime_index(tmp_path):
     """datetime型のIndexが正しく生成されること"""
     frame = FrameSpec(
         id="TimeSeriesFrame",
@@ -63,18 +60,17 @@ def test_generate_pandera_schemas_with_datetime_index():
         frames=[frame],
     )
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_path = Path(tmpdir) / "schemas.py"
-        generate_pandera_schemas(ir, output_path)
+    output_path = tmp_path / "schemas.py"
+    generate_pandera_schemas(ir, output_path)
 
-        assert output_path.exists()
-        content = output_path.read_text()
+    assert output_path.exists()
+    content = output_path.read_text()
 
-        # datetime型の確認
-        assert "timestamp: Index[pd.DatetimeTZDtype]" in content
+    # datetime型の確認
+    assert "timestamp: Index[pd.DatetimeTZDtype]" in content
 
 
-def test_generate_pandera_schemas_with_multi_index():
+def test_generate_pandera_schemas_with_multi_index(tmp_path):
     """MultiIndexが正しく生成されること"""
     frame = FrameSpec(
         id="MultiIndexFrame",
@@ -93,19 +89,18 @@ def test_generate_pandera_schemas_with_multi_index():
         frames=[frame],
     )
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_path = Path(tmpdir) / "schemas.py"
-        generate_pandera_schemas(ir, output_path)
+    output_path = tmp_path / "schemas.py"
+    generate_pandera_schemas(ir, output_path)
 
-        assert output_path.exists()
-        content = output_path.read_text()
+    assert output_path.exists()
+    content = output_path.read_text()
 
-        # MultiIndexの確認
-        assert "level1: Index[str]" in content
-        assert "level2: Index[int]" in content
+    # MultiIndexの確認
+    assert "level1: Index[str]" in content
+    assert "level2: Index[int]" in content
 
 
-def test_generate_pandera_schemas_with_checks():
+def test_generate_pandera_schemas_with_checks(tmp_path):
     """Column checksが正しく生成されること"""
     frame = FrameSpec(
         id="ValidatedFrame",
@@ -129,19 +124,18 @@ def test_generate_pandera_schemas_with_checks():
         frames=[frame],
     )
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_path = Path(tmpdir) / "schemas.py"
-        generate_pandera_schemas(ir, output_path)
+    output_path = tmp_path / "schemas.py"
+    generate_pandera_schemas(ir, output_path)
 
-        assert output_path.exists()
-        content = output_path.read_text()
+    assert output_path.exists()
+    content = output_path.read_text()
 
-        # checksの確認
-        assert "ge=0" in content
-        assert "le=1000" in content
+    # checksの確認
+    assert "ge=0" in content
+    assert "le=1000" in content
 
 
-def test_generate_pandera_schemas_with_config():
+def test_generate_pandera_schemas_with_config(tmp_path):
     """Configが正しく生成されること"""
     frame = FrameSpec(
         id="StrictFrame",
@@ -160,20 +154,19 @@ def test_generate_pandera_schemas_with_config():
         frames=[frame],
     )
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_path = Path(tmpdir) / "schemas.py"
-        generate_pandera_schemas(ir, output_path)
+    output_path = tmp_path / "schemas.py"
+    generate_pandera_schemas(ir, output_path)
 
-        assert output_path.exists()
-        content = output_path.read_text()
+    assert output_path.exists()
+    content = output_path.read_text()
 
-        # Configの確認
-        assert "strict = True" in content
-        assert "coerce = False" in content
-        assert "ordered = True" in content
+    # Configの確認
+    assert "strict = True" in content
+    assert "coerce = False" in content
+    assert "ordered = True" in content
 
 
-def test_generate_pandera_schemas_multiple_frames():
+def test_generate_pandera_schemas_multiple_frames(tmp_path):
     """複数のDataFrameが全て生成されること"""
     frame1 = FrameSpec(
         id="Frame1",
@@ -192,38 +185,36 @@ def test_generate_pandera_schemas_multiple_frames():
         frames=[frame1, frame2],
     )
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_path = Path(tmpdir) / "schemas.py"
-        generate_pandera_schemas(ir, output_path)
+    output_path = tmp_path / "schemas.py"
+    generate_pandera_schemas(ir, output_path)
 
-        assert output_path.exists()
-        content = output_path.read_text()
+    assert output_path.exists()
+    content = output_path.read_text()
 
-        # 両方のSchemaが含まれていることを確認
-        assert "class Frame1Schema(pa.DataFrameModel):" in content
-        assert "class Frame2Schema(pa.DataFrameModel):" in content
+    # 両方のSchemaが含まれていることを確認
+    assert "class Frame1Schema(pa.DataFrameModel):" in content
+    assert "class Frame2Schema(pa.DataFrameModel):" in content
 
 
-def test_generate_pandera_schemas_empty(capsys):
+def test_generate_pandera_schemas_empty(capsys, tmp_path):
     """DataFrameが空の場合、スキップメッセージが出力されること"""
     ir = SpecIR(
         meta=MetaSpec(name="test-project"),
         frames=[],
     )
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_path = Path(tmpdir) / "schemas.py"
-        generate_pandera_schemas(ir, output_path)
+    output_path = tmp_path / "schemas.py"
+    generate_pandera_schemas(ir, output_path)
 
-        # ファイルは生成されない
-        assert not output_path.exists()
+    # ファイルは生成されない
+    assert not output_path.exists()
 
-        # スキップメッセージの確認
-        captured = capsys.readouterr()
-        assert "Skip" in captured.out
+    # スキップメッセージの確認
+    captured = capsys.readouterr()
+    assert "Skip" in captured.out
 
 
-def test_generate_pandera_schemas_with_description():
+def test_generate_pandera_schemas_with_description(tmp_path):
     """Column descriptionがコメントとして出力されること"""
     frame = FrameSpec(
         id="DescribedFrame",
@@ -244,13 +235,12 @@ def test_generate_pandera_schemas_with_description():
         frames=[frame],
     )
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_path = Path(tmpdir) / "schemas.py"
-        generate_pandera_schemas(ir, output_path)
+    output_path = tmp_path / "schemas.py"
+    generate_pandera_schemas(ir, output_path)
 
-        assert output_path.exists()
-        content = output_path.read_text()
+    assert output_path.exists()
+    content = output_path.read_text()
 
-        # descriptionがコメントとして含まれていることを確認
-        assert "# Index field" in content
-        assert "# Value field" in content
+    # descriptionがコメントとして含まれていることを確認
+    assert "# Index field" in content
+    assert "# Value field" in content
@@ -5,7 +5,6 @@ Config YAMLに基づいたDAG実行とパラメータオーバーライドを検
 """
 
 from pathlib import Path
-import tempfile
 import pytest
 import yaml
 
@@ -56,10 +55,9 @@ def sample_spec_path():
 
 
 @pytest.fixture
-def temp_config_dir():
+def temp_config_dir(tmp_path):
     """一時Config用ディレクトリ"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+    return tmp_path
 
 
 @pytest.fixture
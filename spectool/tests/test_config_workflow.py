@@ -3,8 +3,8 @@
 Configが既にある状態で、コード生成→バリデーションが全て通ることを確認する。
 """
 
-from pathlib import Path
-import tempfile
+import sys
+
 import pytest
 import yaml
 
@@ -12,10 +12,9 @@ from spectool.spectool.core.engine.loader import load_spec
 
 
 @pytest.fixture
-def temp_project_dir():
+def temp_project_dir(tmp_path):
     """一時プロジェクトディレクトリ"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+    return tmp_path
 
 
 @pytest.fixture
@@ -167,12 +166,16 @@ def test_config_validation_before_implementation(sample_spec_with_config, temp_p
     assert config_validation["valid"] is True
 
 
-def test_config_validation_after_implementation(sample_spec_with_config, temp_project_dir):
+def test_config_validation_after_implementation(sample_spec_with_config, temp_project_dir, monkeypatch):
     """実装後のConfig検証（check_implementations=True）が通ることを確認"""
     spec_path, config_path = sample_spec_with_config
 
     ir = load_spec(spec_path)
 
+    # 前のテストで読み込んだapps.*のスケルトンを使わないようにする（テスト終了時に元に戻る）
+    for module in [key for key in sys.modules if key.startswith("apps")]:
+        monkeypatch.delitem(sys.modules, module)
+
     # スケルトン生成
     from spectool.spectool.backends.py_skeleton import generate_skeleton
 
@@ -3,8 +3,6 @@
 dag_stagesのi/o dtypeに該当するtransform関数候補が正確に抽出されることを確認する。
 """
 
-from pathlib import Path
-import tempfile
 import pytest
 import yaml
 
@@ -12,10 +10,9 @@ from spectool.spectool.core.engine.loader import load_spec
 
 
 @pytest.fixture
-def temp_spec_dir():
+def temp_spec_dir(tmp_path):
     """一時specディレクトリ"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+    return tmp_path
 
 
 def test_dag_stage_finds_all_matching_candidates(temp_spec_dir):
@@ -5,7 +5,6 @@
 """
 
 from pathlib import Path
-import tempfile
 import pytest
 import shutil
 
@@ -16,10 +15,9 @@ from spectool.spectool.core.engine.integrity import IntegrityValidator
 
 
 @pytest.fixture
-def temp_project_dir():
+def temp_project_dir(tmp_path):
     """一時プロジェクトディレクトリ"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+    return tmp_path
 
 
 @pytest.fixture
@@ -3,19 +3,39 @@
 Exampleの定義と検証が正しく動作することを確認する。
 """
 
-from pathlib import Path
-import tempfile
 import pytest
 import yaml
 
 from spectool.spectool.core.engine.loader import load_spec
 
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+
+
+# 複数のテストで共通のdatatypes定義（各specのdictにそのまま入れる）
+_TEST_FRAME_DATATYPES = [
+    {
+        "id": "TestFrame",
+        "dataframe_schema": {
+            "index": {"name": "idx", "dtype": "int"},
+            "columns": [{"name": "value", "dtype": "float"}],
+        },
+    }
+]
+_TEST_MODEL_DATATYPES = [
+    {
+        "id": "TestModel",
+        "pydantic_model": {"fields": [{"name": "value", "type": {"native": "builtins:int"}}]},
+    }
+]
+
 
 @pytest.fixture
-def temp_spec_dir():
+def temp_spec_dir(tmp_path):
     """一時specディレクトリ"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+    return tmp_path
 
 
 def test_example_linked_to_datatype(temp_spec_dir):
@@ -23,15 +43,7 @@ def test_example_linked_to_datatype(temp_spec_dir):
     spec_data = {
         "version": "1.0",
         "meta": {"name": "example-link_spec"},
-        "datatypes": [
-            {
-                "id": "TestFrame",
-                "dataframe_schema": {
-                    "index": {"name": "idx", "dtype": "int"},
-                    "columns": [{"name": "value", "dtype": "float"}],
-                },
-            }
-        ],
+        "datatypes": _TEST_FRAME_DATATYPES,
         "examples": [
             {
                 "id": "example_1",
@@ -44,8 +56,7 @@ def test_example_linked_to_datatype(temp_spec_dir):
     }
 
     spec_path = temp_spec_dir / "spec.yaml"
-    with open(spec_path, "w") as f:
-        yaml.dump(spec_data, f)
+    spec_path.write_text(yaml.dump(spec_data, Dumper=_Dumper, sort_keys=False))
 
     ir = load_spec(spec_path)
 
@@ -59,15 +70,7 @@ def test_example_without_datatype_ref_detected(temp_spec_dir):
     spec_data = {
         "version": "1.0",
         "meta": {"name": "missing-ref_spec"},
-        "datatypes": [
-            {
-                "id": "TestFrame",
-                "dataframe_schema": {
-                    "index": {"name": "idx", "dtype": "int"},
-                    "columns": [{"name": "value", "dtype": "float"}],
-                },
-            }
-        ],
+        "datatypes": _TEST_FRAME_DATATYPES,
         "examples": [
             {
                 "id": "orphan_example",
@@ -79,8 +82,7 @@ def test_example_without_datatype_ref_detected(temp_spec_dir):
     }
 
     spec_path = temp_spec_dir / "spec.yaml"
-    with open(spec_path, "w") as f:
-        yaml.dump(spec_data, f)
+    spec_path.write_text(yaml.dump(spec_data, Dumper=_Dumper, sort_keys=False))
 
     # バリデーションで警告が出ることを期待
     # （実装依存だが、少なくともエラーにはならない）
@@ -96,15 +98,7 @@ def test_example_references_nonexistent_datatype(temp_spec_dir):
     spec_data = {
         "version": "1.0",
         "meta": {"name": "invalid-ref_spec"},
-        "datatypes": [
-            {
-                "id": "TestFrame",
-                "dataframe_schema": {
-                    "index": {"name": "idx", "dtype": "int"},
-                    "columns": [{"name": "value", "dtype": "float"}],
-                },
-            }
-        ],
+        "datatypes": _TEST_FRAME_DATATYPES,
         "examples": [
             {
                 "id": "bad_example",
@@ -116,8 +110,7 @@ def test_example_references_nonexistent_datatype(temp_spec_dir):
     }
 
     spec_path = temp_spec_dir / "spec.yaml"
-    with open(spec_path, "w") as f:
-        yaml.dump(spec_data, f)
+    spec_path.write_text(yaml.dump(spec_data, Dumper=_Dumper, sort_keys=False))
 
     # バリデーションでエラーが検出されることを期待
     from spectool.spectool.core.engine.validate import validate_spec
@@ -163,8 +156,7 @@ def test_example_input_matches_datatype_schema(temp_spec_dir):
     }
 
     spec_path = temp_spec_dir / "spec.yaml"
-    with open(spec_path, "w") as f:
-        yaml.dump(spec_data, f)
+    spec_path.write_text(yaml.dump(spec_data, Dumper=_Dumper, sort_keys=False))
 
     ir = load_spec(spec_path)
 
@@ -204,8 +196,7 @@ def test_example_input_violates_datatype_schema(temp_spec_dir):
     }
 
     spec_path = temp_spec_dir / "spec.yaml"
-    with open(spec_path, "w") as f:
-        yaml.dump(spec_data, f)
+    spec_path.write_text(yaml.dump(spec_data, Dumper=_Dumper, sort_keys=False))
 
     from spectool.spectool.core.engine.validate import validate_spec
 
@@ -222,15 +213,7 @@ def test_multiple_examples_for_same_datatype(temp_spec_dir):
     spec_data = {
         "version": "1.0",
         "meta": {"name": "multiple-examples_spec"},
-        "datatypes": [
-            {
-                "id": "TestFrame",
-                "dataframe_schema": {
-                    "index": {"name": "idx", "dtype": "int"},
-                    "columns": [{"name": "value", "dtype": "float"}],
-                },
-            }
-        ],
+        "datatypes": _TEST_FRAME_DATATYPES,
         "examples": [
             {
                 "id": "example_1",
@@ -248,8 +231,7 @@ def test_multiple_examples_for_same_datatype(temp_spec_dir):
     }
 
     spec_path = temp_spec_dir / "spec.yaml"
-    with open(spec_path, "w") as f:
-        yaml.dump(spec_data, f)
+    spec_path.write_text(yaml.dump(spec_data, Dumper=_Dumper, sort_keys=False))
 
     ir = load_spec(spec_path)
 
@@ -302,8 +284,7 @@ def test_example_expected_output_validation(temp_spec_dir):
     }
 
     spec_path = temp_spec_dir / "spec.yaml"
-    with open(spec_path, "w") as f:
-        yaml.dump(spec_data, f)
+    spec_path.write_text(yaml.dump(spec_data, Dumper=_Dumper, sort_keys=False))
 
     ir = load_spec(spec_path)
 
@@ -316,15 +297,7 @@ def test_example_without_expected_is_valid(temp_spec_dir):
     spec_data = {
         "version": "1.0",
         "meta": {"name": "input-only-example_spec"},
-        "datatypes": [
-            {
-                "id": "TestFrame",
-                "dataframe_schema": {
-                    "index": {"name": "idx", "dtype": "int"},
-                    "columns": [{"name": "value", "dtype": "float"}],
-                },
-            }
-        ],
+        "datatypes": _TEST_FRAME_DATATYPES,
         "examples": [
             {
                 "id": "input_only_example",
@@ -337,8 +310,7 @@ def test_example_without_expected_is_valid(temp_spec_dir):
     }
 
     spec_path = temp_spec_dir / "spec.yaml"
-    with open(spec_path, "w") as f:
-        yaml.dump(spec_data, f)
+    spec_path.write_text(yaml.dump(spec_data, Dumper=_Dumper, sort_keys=False))
 
     try:
         ir = load_spec(spec_path)
@@ -352,18 +324,12 @@ def test_datatype_without_example_or_generator_fails(temp_spec_dir):
     spec_data = {
         "version": "1.0",
         "meta": {"name": "no-example-no-generator_spec"},
-        "datatypes": [
-            {
-                "id": "TestModel",
-                "pydantic_model": {"fields": [{"name": "value", "type": {"native": "builtins:int"}}]},
-            }
-        ],
+        "datatypes": _TEST_MODEL_DATATYPES,
         # examplesセクションなし、generatorsセクションなし
     }
 
     spec_path = temp_spec_dir / "spec.yaml"
-    with open(spec_path, "w") as f:
-        yaml.dump(spec_data, f)
+    spec_path.write_text(yaml.dump(spec_data, Dumper=_Dumper, sort_keys=False))
 
     from spectool.spectool.core.engine.validate import validate_spec
 
@@ -389,6 +355,7 @@ def test_datatype_with_example_passes(temp_spec_dir):
     spec_data = {
         "version": "1.0",
         "meta": {"name": "with-example_spec"},
+        "datatypes": _TEST_MODEL_DATATYPES,
         "examples": [
             {
                 "id": "ex_test",
@@ -397,17 +364,10 @@ def test_datatype_with_example_passes(temp_spec_dir):
                 "expected": {"valid": True},
             }
         ],
-        "datatypes": [
-            {
-                "id": "TestModel",
-                "pydantic_model": {"fields": [{"name": "value", "type": {"native": "builtins:int"}}]},
-            }
-        ],
     }
 
     spec_path = temp_spec_dir / "spec.yaml"
-    with open(spec_path, "w") as f:
-        yaml.dump(spec_data, f)
+    spec_path.write_text(yaml.dump(spec_data, Dumper=_Dumper, sort_keys=False))
 
     from spectool.spectool.core.engine.validate import validate_spec
 
@@ -425,6 +385,7 @@ def test_datatype_with_generator_passes(temp_spec_dir):
     spec_data = {
         "version": "1.0",
         "meta": {"name": "with-generator_spec"},
+        "datatypes": _TEST_MODEL_DATATYPES,
         "generators": [
             {
                 "id": "gen_test",
@@ -433,17 +394,10 @@ def test_datatype_with_generator_passes(temp_spec_dir):
                 "return_type_ref": "TestModel",
             }
         ],
-        "datatypes": [
-            {
-                "id": "TestModel",
-                "pydantic_model": {"fields": [{"name": "value", "type": {"native": "builtins:int"}}]},
-            }
-        ],
     }
 
     spec_path = temp_spec_dir / "spec.yaml"
-    with open(spec_path, "w") as f:
-        yaml.dump(spec_data, f)
+    spec_path.write_text(yaml.dump(spec_data, Dumper=_Dumper, sort_keys=False))
 
     from spectool.spectool.core.engine.validate import validate_spec
 
@@ -461,6 +415,7 @@ def test_datatype_with_both_example_and_generator_passes(temp_spec_dir):
     spec_data = {
         "version": "1.0",
         "meta": {"name": "with-both_spec"},
+        "datatypes": _TEST_MODEL_DATATYPES,
         "examples": [
             {
                 "id": "ex_test",
@@ -477,17 +432,10 @@ def test_datatype_with_both_example_and_generator_passes(temp_spec_dir):
                 "return_type_ref": "TestModel",
             }
         ],
-        "datatypes": [
-            {
-                "id": "TestModel",
-                "pydantic_model": {"fields": [{"name": "value", "type": {"native": "builtins:int"}}]},
-            }
-        ],
     }
 
     spec_path = temp_spec_dir / "spec.yaml"
-    with open(spec_path, "w") as f:
-        yaml.dump(spec_data, f)
+    spec_path.write_text(yaml.dump(spec_data, Dumper=_Dumper, sort_keys=False))
 
     from spectool.spectool.core.engine.validate import validate_spec
 
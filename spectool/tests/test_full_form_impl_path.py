@@ -4,8 +4,6 @@ apps.project_name.module:func 形式のimplパスが正しく処理されるこ
 短縮形式 apps.module:func と混在していても正しく動作すること。
 """
 
-from pathlib import Path
-import tempfile
 import pytest
 
 from spectool.spectool.core.engine.loader import load_spec
@@ -15,10 +13,9 @@ from spectool.spectool.core.engine.integrity import IntegrityValidator
 
 
 @pytest.fixture
-def temp_project_dir():
+def temp_project_dir(tmp_path):
     """一時プロジェクトディレクトリ"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+    return tmp_path
 
 
 @pytest.fixture
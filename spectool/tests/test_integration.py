@@ -3,7 +3,6 @@
 Loader → Normalizer → Validator → Backend の全フローを統合テスト
 """
 
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -5,7 +5,6 @@ packages/tests/test_integrity_validation.pyに相当する機能をspectoolで
 """
 
 from pathlib import Path
-import tempfile
 import pytest
 
 from spectool.spectool.core.engine.loader import load_spec
@@ -26,10 +25,9 @@ def sample_spec_path():
 
 
 @pytest.fixture
-def temp_project_dir():
+def temp_project_dir(tmp_path):
     """一時プロジェクトディレクトリ"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+    return tmp_path
 
 
 @pytest.fixture
@@ -3,7 +3,8 @@
 from pathlib import Path
 
 import pytest
-from spectool.spectool.core.engine.loader import load_spec
+import yaml
+from spectool.spectool.core.engine.loader import load_spec, load_spec_from_str
 
 
 def test_load_minimal_spec():
@@ -150,6 +151,13 @@ def test_load_meta():
     assert ir.meta.version == "1.0"
 
 
+def test_load_spec_from_str_matches_file():
+    """文字列からの読み込みがファイル読み込みと同じIRになる"""
+    spec_path = Path(__file__).parent / "fixtures" / "sample_spec.yaml"
+
+    assert load_spec_from_str(spec_path.read_text()) == load_spec(spec_path)
+
+
 def test_load_nonexistent_file():
     """存在しないファイルの読み込みエラー"""
     with pytest.raises(FileNotFoundError):
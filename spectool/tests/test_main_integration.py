@@ -5,12 +5,21 @@ SpectoolCLIクラスの各コマンドが最低限動作することを確認す
 """
 
 import json
+import os
 import subprocess
 import sys
 from pathlib import Path
 
 import pytest
 
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _cwd_independent_env() -> dict[str, str]:
+    """リポジトリ直下以外をカレントディレクトリにしても `python -m spectool` を実行できる環境変数"""
+    pythonpath = os.pathsep.join(filter(None, [str(_REPO_ROOT), os.environ.get("PYTHONPATH")]))
+    return {**os.environ, "PYTHONPATH": pythonpath}
+
 
 class TestValidateCommand:
     """validate コマンドの統合テスト"""
@@ -118,19 +127,22 @@ class TestGenCommand:
             if dir_path.exists():
                 assert dir_path.is_dir()
 
-    def test_gen_without_output_dir_uses_current_dir(self):
+    def test_gen_without_output_dir_uses_current_dir(self, tmp_path: Path):
         """--output-dir なしの場合はカレントディレクトリに生成される"""
-        spec_path = Path("spectool/tests/fixtures/minimal_spec.yaml")
+        spec_path = _REPO_ROOT / "spectool/tests/fixtures/minimal_spec.yaml"
 
+        # リポジトリ直下に生成物を残さないよう、tmp_pathをカレントディレクトリにして実行する
         result = subprocess.run(
             [sys.executable, "-m", "spectool", "gen", str(spec_path)],
             capture_output=True,
             text=True,
+            cwd=tmp_path,
+            env=_cwd_independent_env(),
         )
         assert result.returncode == 0
         assert "✅" in result.stdout
 
-        # 生成が成功することを確認（実際の出力先はクリーンアップのため検証しない）
+        assert (tmp_path / "apps" / "minimal_test").exists()
 
     def test_gen_invalid_spec_fails(self, tmp_path: Path):
         """不正なspecでgenが失敗する"""
@@ -181,7 +193,6 @@ datatypes:
 
     def test_validate_integrity_after_generation_succeeds(self, tmp_path: Path):
         """生成後のvalidate-integrityは成功する（生成されたコードのまま）"""
-        # プロジェクトルートに生成してテスト後にクリーンアップする方式を採用
         spec_content = """version: "1.0"
 meta:
   name: integrity_test_temp
@@ -211,35 +222,30 @@ datatypes:
         spec_path = tmp_path / "test_spec.yaml"
         spec_path.write_text(spec_content)
 
-        # プロジェクトルート（カレントディレクトリ）に生成
+        # tmp_pathをカレントディレクトリにして生成・検証する（リポジトリ直下のappsには書き込まない）
         gen_result = subprocess.run(
             [sys.executable, "-m", "spectool", "gen", str(spec_path)],
             capture_output=True,
             text=True,
+            cwd=tmp_path,
+            env=_cwd_independent_env(),
         )
         assert gen_result.returncode == 0
 
-        try:
-            # 生成されたプロジェクトが存在することを確認
-            app_dir = Path("apps/integrity_test_temp")
-            assert app_dir.exists(), f"Generated app directory not found: {app_dir}"
-
-            # validate-integrityを実行
-            result = subprocess.run(
-                [sys.executable, "-m", "spectool", "validate-integrity", str(spec_path)],
-                capture_output=True,
-                text=True,
-            )
-            assert result.returncode == 0, f"validate-integrity failed:\n{result.stdout}\n{result.stderr}"
-            assert "✅" in result.stdout
-
-        finally:
-            # クリーンアップ：生成されたディレクトリを削除
-            import shutil
+        # 生成されたプロジェクトが存在することを確認
+        app_dir = tmp_path / "apps" / "integrity_test_temp"
+        assert app_dir.exists(), f"Generated app directory not found: {app_dir}"
 
-            app_dir = Path("apps/integrity_test_temp")
-            if app_dir.exists():
-                shutil.rmtree(app_dir)
+        # validate-integrityを実行
+        result = subprocess.run(
+            [sys.executable, "-m", "spectool", "validate-integrity", str(spec_path)],
+            capture_output=True,
+            text=True,
+            cwd=tmp_path,
+            env=_cwd_independent_env(),
+        )
+        assert result.returncode == 0, f"validate-integrity failed:\n{result.stdout}\n{result.stderr}"
+        assert "✅" in result.stdout
 
 
 class TestRunCommand:
@@ -6,15 +6,28 @@ doc/new_packages.md の推奨設計に基づく統合テスト。
 
 import re
 from pathlib import Path
-from tempfile import TemporaryDirectory
 
 import pytest
 
-from spectool.spectool.core.engine.loader import load_spec
+from spectool.spectool.core.engine.loader import load_spec_from_str
 from spectool.spectool.backends.py_skeleton import generate_skeleton
 
+_SCHEMA_SPEC_RE = re.compile(r"SchemaSpec\(")
+# PydanticRowRef / SchemaSpec の出現位置を1回の走査で取得するためのパターン
+_ROW_REF_OR_SCHEMA_RE = re.compile(r"PydanticRowRef\(|SchemaSpec\(")
 
-def test_dataframe_type_alias_includes_schema_spec():
+
+def _generate_types(spec_yaml: str, app_name: str, output_dir: Path) -> str:
+    """specテキストからスケルトンを output_dir に生成し、types.pyの内容を返す"""
+    ir = load_spec_from_str(spec_yaml)
+    generate_skeleton(ir, output_dir)
+
+    types_file = output_dir / "apps" / app_name / "types.py"
+    assert types_file.exists(), f"types.py が生成されていません: {types_file}"
+    return types_file.read_text()
+
+
+def test_dataframe_type_alias_includes_schema_spec(tmp_path):
     """DataFrame TypeAliasにSchemaSpecメタデータが含まれることを検証"""
 
     # テスト用のspec YAML
@@ -59,50 +72,34 @@ checks:
     file_path: "checks/validators.py"
 """
 
-    with TemporaryDirectory() as tmpdir:
-        tmppath = Path(tmpdir)
-
-        # Specファイルを作成
-        spec_path = tmppath / "test_spec.yaml"
-        spec_path.write_text(spec_yaml)
-
-        # Specをロード
-        ir = load_spec(spec_path)
+    # スケルトンコードを生成し、types.pyを確認
+    content = _generate_types(spec_yaml, "test_schema_spec", tmp_path)
 
-        # スケルトンコード生成
-        generate_skeleton(ir, tmppath)
+    # 1. SchemaSpecがインポートされていることを確認
+    assert "from spectool.spectool.core.base.meta_types import SchemaSpec" in content, (
+        "SchemaSpecのインポートが見つかりません"
+    )
 
-        # 生成されたtypes.pyを確認
-        types_file = tmppath / "apps" / "test_schema_spec" / "types.py"
-        assert types_file.exists(), f"types.py が生成されていません: {types_file}"
+    # 2. TestFrame TypeAliasが存在することを確認
+    assert "TestFrame: TypeAlias = Annotated[" in content, "TestFrame TypeAliasが見つかりません"
 
-        content = types_file.read_text()
+    # 3. SchemaSpecメタデータが含まれていることを確認
+    assert _SCHEMA_SPEC_RE.search(content), "SchemaSpecメタデータが含まれていません"
 
-        # 1. SchemaSpecがインポートされていることを確認
-        assert "from spectool.spectool.core.base.meta_types import SchemaSpec" in content, (
-            "SchemaSpecのインポートが見つかりません"
-        )
+    # 4. Index定義がSchemaSpecに含まれていることを確認
+    assert "'name': 'timestamp'" in content, "Index名がSchemaSpecに含まれていません"
+    assert "'dtype': 'datetime'" in content, "Index dtypeがSchemaSpecに含まれていません"
 
-        # 2. TestFrame TypeAliasが存在することを確認
-        assert "TestFrame: TypeAlias = Annotated[" in content, "TestFrame TypeAliasが見つかりません"
+    # 5. Columns定義がSchemaSpecに含まれていることを確認
+    assert "'name': 'price'" in content, "price列がSchemaSpecに含まれていません"
+    assert "'name': 'volume'" in content, "volume列がSchemaSpecに含まれていません"
 
-        # 3. SchemaSpecメタデータが含まれていることを確認
-        assert "SchemaSpec(" in content, "SchemaSpecメタデータが含まれていません"
+    # 6. Column checks定義がSchemaSpecに含まれていることを確認
+    assert "'checks':" in content, "Column checksがSchemaSpecに含まれていません"
+    assert "'type': 'ge'" in content, "Check typeがSchemaSpecに含まれていません"
 
-        # 4. Index定義がSchemaSpecに含まれていることを確認
-        assert "'name': 'timestamp'" in content, "Index名がSchemaSpecに含まれていません"
-        assert "'dtype': 'datetime'" in content, "Index dtypeがSchemaSpecに含まれていません"
 
-        # 5. Columns定義がSchemaSpecに含まれていることを確認
-        assert "'name': 'price'" in content, "price列がSchemaSpecに含まれていません"
-        assert "'name': 'volume'" in content, "volume列がSchemaSpecに含まれていません"
-
-        # 6. Column checks定義がSchemaSpecに含まれていることを確認
-        assert "'checks':" in content, "Column checksがSchemaSpecに含まれていません"
-        assert "'type': 'ge'" in content, "Check typeがSchemaSpecに含まれていません"
-
-
-def test_multiindex_dataframe_schema_spec():
+def test_multiindex_dataframe_schema_spec(tmp_path):
     """MultiIndex DataFrameのSchemaSpec生成を検証"""
 
     spec_yaml = """
@@ -140,33 +137,17 @@ checks:
     file_path: "checks/validators.py"
 """
 
-    with TemporaryDirectory() as tmpdir:
-        tmppath = Path(tmpdir)
-
-        # Specファイルを作成
-        spec_path = tmppath / "test_spec.yaml"
-        spec_path.write_text(spec_yaml)
-
-        # Specをロード
-        ir = load_spec(spec_path)
-
-        # スケルトンコード生成
-        generate_skeleton(ir, tmppath)
+    # スケルトンコードを生成し、types.pyを確認
+    content = _generate_types(spec_yaml, "test_multiindex", tmp_path)
 
-        # 生成されたtypes.pyを確認
-        types_file = tmppath / "apps" / "test_multiindex" / "types.py"
-        assert types_file.exists()
+    # MultiIndex定義がSchemaSpecに含まれていることを確認
+    assert _SCHEMA_SPEC_RE.search(content)
+    assert "'name': 'symbol'" in content
+    assert "'name': 'timestamp'" in content
+    assert "'dtype': 'string'" in content or "'dtype': 'datetime'" in content
 
-        content = types_file.read_text()
 
-        # MultiIndex定義がSchemaSpecに含まれていることを確認
-        assert "SchemaSpec(" in content
-        assert "'name': 'symbol'" in content
-        assert "'name': 'timestamp'" in content
-        assert "'dtype': 'string'" in content or "'dtype': 'datetime'" in content
-
-
-def test_schema_spec_with_pydantic_row_ref():
+def test_schema_spec_with_pydantic_row_ref(tmp_path):
     """PydanticRowRefとSchemaSpecの共存を検証"""
 
     spec_yaml = """
@@ -220,36 +201,23 @@ checks:
     file_path: "checks/validators.py"
 """
 
-    with TemporaryDirectory() as tmpdir:
-        tmppath = Path(tmpdir)
-
-        # Specファイルを作成
-        spec_path = tmppath / "test_spec.yaml"
-        spec_path.write_text(spec_yaml)
-
-        # Specをロード
-        ir = load_spec(spec_path)
-
-        # スケルトンコード生成
-        generate_skeleton(ir, tmppath)
-
-        # 生成されたtypes.pyを確認
-        types_file = tmppath / "apps" / "test_pydantic_schema" / "types.py"
-        assert types_file.exists()
+    # スケルトンコードを生成し、types.pyを確認
+    content = _generate_types(spec_yaml, "test_pydantic_schema", tmp_path)
 
-        content = types_file.read_text()
+    # PydanticRowRefとSchemaSpecの両方が含まれていることを確認
+    first_pos: dict[str, int] = {}
+    for match in _ROW_REF_OR_SCHEMA_RE.finditer(content):
+        first_pos.setdefault(match.group(0), match.start())
+    assert "PydanticRowRef(" in first_pos, "PydanticRowRefが含まれていません"
+    assert "SchemaSpec(" in first_pos, "SchemaSpecが含まれていません"
 
-        # PydanticRowRefとSchemaSpecの両方が含まれていることを確認
-        assert "PydanticRowRef(" in content, "PydanticRowRefが含まれていません"
-        assert "SchemaSpec(" in content, "SchemaSpecが含まれていません"
+    # 順序確認: PydanticRowRef -> SchemaSpec -> GeneratorSpec -> CheckedSpec
+    pydantic_pos = first_pos["PydanticRowRef("]
+    schema_pos = first_pos["SchemaSpec("]
+    assert pydantic_pos < schema_pos, "PydanticRowRefがSchemaSpecより後に配置されています"
 
-        # 順序確認: PydanticRowRef -> SchemaSpec -> GeneratorSpec -> CheckedSpec
-        pydantic_pos = content.find("PydanticRowRef(")
-        schema_pos = content.find("SchemaSpec(")
-        assert pydantic_pos < schema_pos, "PydanticRowRefがSchemaSpecより後に配置されています"
 
-
-def test_generated_schema_spec_is_valid_python():
+def test_generated_schema_spec_is_valid_python(tmp_path):
     """生成されたSchemaSpecが有効なPythonコードであることを検証"""
 
     spec_yaml = """
@@ -280,27 +248,11 @@ checks:
     file_path: "checks/validators.py"
 """
 
-    with TemporaryDirectory() as tmpdir:
-        tmppath = Path(tmpdir)
-
-        # Specファイルを作成
-        spec_path = tmppath / "test_spec.yaml"
-        spec_path.write_text(spec_yaml)
-
-        # Specをロード
-        ir = load_spec(spec_path)
-
-        # スケルトンコード生成
-        generate_skeleton(ir, tmppath)
-
-        # 生成されたtypes.pyを確認
-        types_file = tmppath / "apps" / "test_valid_python" / "types.py"
-        assert types_file.exists()
-
-        content = types_file.read_text()
+    # スケルトンコードを生成し、types.pyを確認
+    content = _generate_types(spec_yaml, "test_valid_python", tmp_path)
 
-        # Pythonとして正しくコンパイルできることを確認
-        try:
-            compile(content, str(types_file), "exec")
-        except SyntaxError as e:
-            pytest.fail(f"生成されたコードにSyntax Errorがあります: {e}\n\nContent:\n{content}")
+    # Pythonとして正しくコンパイルできることを確認
+    try:
+        compile(content, "types.py", "exec")
+    except SyntaxError as e:
+        pytest.fail(f"生成されたコードにSyntax Errorがあります: {e}\n\nContent:\n{content}")
@@ -5,7 +5,6 @@ Check関数、Transform関数、Generator関数のスケルトンコード生成
 """
 
 from pathlib import Path
-import tempfile
 import pytest
 
 from spectool.spectool.core.engine.loader import load_spec
@@ -23,17 +22,30 @@ except ImportError:
         raise NotImplementedError("Skeleton generation not yet implemented in spectool")
 
 
+_SAMPLE_SPEC_PATH = Path(__file__).parent / "fixtures" / "sample_spec.yaml"
+
+
 @pytest.fixture
 def sample_spec_path():
     """サンプルspec YAMLのパス"""
-    return Path(__file__).parent / "fixtures" / "sample_spec.yaml"
+    return _SAMPLE_SPEC_PATH
 
 
 @pytest.fixture
-def temp_output_dir():
+def temp_output_dir(tmp_path):
     """一時出力ディレクトリ"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+    return tmp_path
+
+
+@pytest.fixture(scope="session")
+def generated_sample_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """サンプルspecのスケルトンをセッション（xdistではワーカー）ごとに1回だけ生成して共有
+
+    生成物を書き換えるテストでは使わず、temp_output_dir を使うこと。
+    """
+    output_dir = tmp_path_factory.mktemp("skeleton")
+    generate_skeleton(load_spec(_SAMPLE_SPEC_PATH), output_dir)
+    return output_dir
 
 
 def test_spec_loads_correctly(sample_spec_path):
@@ -52,13 +64,10 @@ def test_spec_loads_correctly(sample_spec_path):
     assert ir.transforms[0].id == "process_data"
 
 
-def test_generate_check_function_skeletons(sample_spec_path, temp_output_dir):
+def test_generate_check_function_skeletons(generated_sample_dir):
     """Check関数のスケルトンが生成されることを確認"""
-    ir = load_spec(sample_spec_path)
-    generate_skeleton(ir, temp_output_dir)
-
     # Check関数ファイルが生成されることを確認
-    check_file = temp_output_dir / "apps" / "sample_project" / "checks" / "validators.py"
+    check_file = generated_sample_dir / "apps" / "sample_project" / "checks" / "validators.py"
     assert check_file.exists()
 
     content = check_file.read_text()
@@ -68,13 +77,10 @@ def test_generate_check_function_skeletons(sample_spec_path, temp_output_dir):
     assert "TODO" in content  # スケルトンにはTODOコメントが含まれる
 
 
-def test_generate_transform_function_skeletons(sample_spec_path, temp_output_dir):
+def test_generate_transform_function_skeletons(generated_sample_dir):
     """Transform関数のスケルトンが生成されることを確認"""
-    ir = load_spec(sample_spec_path)
-    generate_skeleton(ir, temp_output_dir)
-
     # Transform関数ファイルが生成されることを確認
-    transform_file = temp_output_dir / "apps" / "sample_project" / "transforms" / "processors.py"
+    transform_file = generated_sample_dir / "apps" / "sample_project" / "transforms" / "processors.py"
     assert transform_file.exists()
 
     content = transform_file.read_text()
@@ -93,13 +99,10 @@ def test_generate_transform_function_skeletons(sample_spec_path, temp_output_dir
     assert "TODO" in content
 
 
-def test_generate_generator_function_skeletons(sample_spec_path, temp_output_dir):
+def test_generate_generator_function_skeletons(generated_sample_dir):
     """Generator関数のスケルトンが生成されることを確認"""
-    ir = load_spec(sample_spec_path)
-    generate_skeleton(ir, temp_output_dir)
-
     # Generator関数ファイルが生成されることを確認
-    generator_file = temp_output_dir / "apps" / "sample_project" / "generators" / "data_generators.py"
+    generator_file = generated_sample_dir / "apps" / "sample_project" / "generators" / "data_generators.py"
     assert generator_file.exists()
 
     content = generator_file.read_text()
@@ -109,12 +112,9 @@ def test_generate_generator_function_skeletons(sample_spec_path, temp_output_dir
     assert "-> " in content  # 戻り値型アノテーション
 
 
-def test_generated_code_has_type_annotations(sample_spec_path, temp_output_dir):
+def test_generated_code_has_type_annotations(generated_sample_dir):
     """生成されたコードに正しい型アノテーションが含まれることを確認"""
-    ir = load_spec(sample_spec_path)
-    generate_skeleton(ir, temp_output_dir)
-
-    transform_file = temp_output_dir / "apps" / "sample_project" / "transforms" / "processors.py"
+    transform_file = generated_sample_dir / "apps" / "sample_project" / "transforms" / "processors.py"
     content = transform_file.read_text()
 
     # 型アノテーションの確認（TypeAliasを使用）
@@ -127,22 +127,18 @@ def test_generated_code_has_type_annotations(sample_spec_path, temp_output_dir):
     assert "-> TimeSeriesFrame" in content
 
 
-def test_generated_directory_structure(sample_spec_path, temp_output_dir):
+def test_generated_directory_structure(generated_sample_dir):
     """生成されたディレクトリ構造が正しいことを確認"""
-    ir = load_spec(sample_spec_path)
-    generate_skeleton(ir, temp_output_dir)
+    app_root = generated_sample_dir / "apps" / "sample_project"
 
-    app_root = temp_output_dir / "apps" / "sample_project"
+    # ディレクトリツリーを1回だけ走査して生成物の一覧を取得
+    names = {p.relative_to(app_root).as_posix() for p in app_root.rglob("*")}
 
     # ディレクトリ構造の確認
-    assert (app_root / "checks").exists()
-    assert (app_root / "transforms").exists()
-    assert (app_root / "generators").exists()
+    assert {"checks", "transforms", "generators"} <= names
 
     # __init__.pyファイルの確認
-    assert (app_root / "checks" / "__init__.py").exists()
-    assert (app_root / "transforms" / "__init__.py").exists()
-    assert (app_root / "generators" / "__init__.py").exists()
+    assert {"checks/__init__.py", "transforms/__init__.py", "generators/__init__.py"} <= names
 
 
 def test_skeleton_generation_is_idempotent(sample_spec_path, temp_output_dir):
@@ -167,12 +163,9 @@ def test_skeleton_generation_is_idempotent(sample_spec_path, temp_output_dir):
     assert "# Custom implementation" in final_content
 
 
-def test_generate_check_function_with_correct_signature(sample_spec_path, temp_output_dir):
+def test_generate_check_function_with_correct_signature(generated_sample_dir):
     """Check関数が正しいシグネチャで生成されることを確認"""
-    ir = load_spec(sample_spec_path)
-    generate_skeleton(ir, temp_output_dir)
-
-    check_file = temp_output_dir / "apps" / "sample_project" / "checks" / "validators.py"
+    check_file = generated_sample_dir / "apps" / "sample_project" / "checks" / "validators.py"
     content = check_file.read_text()
 
     # Check関数は input_type_ref に指定された型（DataPoint）を受け取り bool を返す
@@ -181,13 +174,10 @@ def test_generate_check_function_with_correct_signature(sample_spec_path, temp_o
     assert "from apps.sample_project.models.models import DataPoint" in content
 
 
-def test_generate_enum_datatypes(sample_spec_path, temp_output_dir):
+def test_generate_enum_datatypes(generated_sample_dir):
     """Enum型が生成されることを確認"""
-    ir = load_spec(sample_spec_path)
-    generate_skeleton(ir, temp_output_dir)
-
     # Enumファイルが生成されることを確認
-    enum_file = temp_output_dir / "apps" / "sample_project" / "models" / "enums.py"
+    enum_file = generated_sample_dir / "apps" / "sample_project" / "models" / "enums.py"
     assert enum_file.exists()
 
     content = enum_file.read_text()
@@ -198,13 +188,10 @@ def test_generate_enum_datatypes(sample_spec_path, temp_output_dir):
     assert "INACTIVE" in content
 
 
-def test_generate_pydantic_models(sample_spec_path, temp_output_dir):
+def test_generate_pydantic_models(generated_sample_dir):
     """Pydanticモデルが生成されることを確認"""
-    ir = load_spec(sample_spec_path)
-    generate_skeleton(ir, temp_output_dir)
-
     # Pydanticモデルファイルが生成されることを確認
-    model_file = temp_output_dir / "apps" / "sample_project" / "models" / "models.py"
+    model_file = generated_sample_dir / "apps" / "sample_project" / "models" / "models.py"
     assert model_file.exists()
 
     content = model_file.read_text()
@@ -215,14 +202,11 @@ def test_generate_pydantic_models(sample_spec_path, temp_output_dir):
     assert "value:" in content
 
 
-def test_generate_dataframe_schemas(sample_spec_path, temp_output_dir):
+def test_generate_dataframe_schemas(generated_sample_dir):
     """DataFrame Schemaが生成されることを確認"""
-    ir = load_spec(sample_spec_path)
-    generate_skeleton(ir, temp_output_dir)
-
     # Pandera Schemaファイルが既に存在することを確認
     # （この機能は既にspectoolに実装されている）
-    schema_file = temp_output_dir / "apps" / "sample_project" / "schemas" / "dataframe_schemas.py"
+    schema_file = generated_sample_dir / "apps" / "sample_project" / "schemas" / "dataframe_schemas.py"
     assert schema_file.exists()
 
     content = schema_file.read_text()
@@ -231,16 +215,13 @@ def test_generate_dataframe_schemas(sample_spec_path, temp_output_dir):
     assert "TimeSeriesFrameSchema" in content
 
 
-def test_generator_function_return_type_is_resolved(sample_spec_path, temp_output_dir):
+def test_generator_function_return_type_is_resolved(generated_sample_dir):
     """Generator関数のreturn_type_refが正しく解決されることを確認
 
     問題：generator関数が全てpd.DataFrameを返すようにハードコードされていた。
     修正後：return_type_refを使って正しい型を返すべき。
     """
-    ir = load_spec(sample_spec_path)
-    generate_skeleton(ir, temp_output_dir)
-
-    generator_file = temp_output_dir / "apps" / "sample_project" / "generators" / "data_generators.py"
+    generator_file = generated_sample_dir / "apps" / "sample_project" / "generators" / "data_generators.py"
     content = generator_file.read_text()
 
     # generate_timeseries は TimeSeriesFrame (DataFrame型エイリアス) を返すべき
@@ -3,20 +3,18 @@
 Issue: transform関数生成時にimportが欠落し、型が過度にAnyになる問題を検証
 """
 
-import tempfile
+import re
 from pathlib import Path
 
 import pytest
 
 from spectool.spectool.backends.py_skeleton import generate_skeleton
-from spectool.spectool.core.engine.loader import load_spec
+from spectool.spectool.core.base.ir import SpecIR
+from spectool.spectool.core.engine.loader import load_spec_from_str
 from spectool.spectool.core.engine.normalizer import normalize_ir
 
 
-@pytest.fixture
-def sample_spec_with_models(tmp_path: Path) -> Path:
-    """Pydanticモデルを使用するspecを作成"""
-    spec_content = """
+_SPEC_SAMPLE_MODELS = """
 version: "1"
 meta:
   name: "test-imports"
@@ -72,57 +70,8 @@ transforms:
         datatype_ref: Status
     return_type_ref: Result
 """
-    spec_path = tmp_path / "test_spec.yaml"
-    spec_path.write_text(spec_content)
-    return spec_path
 
-
-def test_transform_has_correct_imports(sample_spec_with_models: Path, tmp_path: Path):
-    """Transform関数のimportが正しく生成されることを確認"""
-    # Spec読み込み
-    raw_ir = load_spec(str(sample_spec_with_models))
-    ir = normalize_ir(raw_ir)
-
-    # スケルトン生成
-    output_dir = tmp_path / "output"
-    generate_skeleton(ir, output_dir)
-
-    # 生成されたtransforms.pyを確認
-    transform_file = output_dir / "apps" / "test_imports" / "transforms" / "transforms.py"
-    assert transform_file.exists(), f"Transform file not found: {transform_file}"
-
-    content = transform_file.read_text()
-
-    # 必要なimportが含まれていることを確認
-    assert "from apps.test_imports.models.models import Config" in content, "Config import missing"
-    assert "from apps.test_imports.models.models import Result" in content, "Result import missing"
-    assert "from apps.test_imports.models.enums import Status" in content, "Status import missing"
-
-
-def test_transform_has_correct_type_annotations(sample_spec_with_models: Path, tmp_path: Path):
-    """Transform関数の型アノテーションが正しく生成されることを確認"""
-    # Spec読み込み
-    raw_ir = load_spec(str(sample_spec_with_models))
-    ir = normalize_ir(raw_ir)
-
-    # スケルトン生成
-    output_dir = tmp_path / "output"
-    generate_skeleton(ir, output_dir)
-
-    # 生成されたtransforms.pyを確認
-    transform_file = output_dir / "apps" / "test_imports" / "transforms" / "transforms.py"
-    content = transform_file.read_text()
-
-    # 型アノテーションが正しいことを確認
-    assert "def process_config(config: Config, status: Status) -> Result:" in content, (
-        "Function signature with correct types not found"
-    )
-    assert "-> Any:" not in content, "Any type should not be used when types are defined"
-
-
-def test_transform_with_dataframe_has_pandas_import(tmp_path: Path):
-    """DataFrame型を使用するtransformにpandasのimportが含まれることを確認"""
-    spec_content = """
+_SPEC_DATAFRAME = """
 version: "1"
 meta:
   name: "test-dataframe"
@@ -143,48 +92,8 @@ transforms:
         datatype_ref: DataFrameType
     return_type_ref: DataFrameType
 """
-    spec_path = tmp_path / "spec.yaml"
-    spec_path.write_text(spec_content)
 
-    raw_ir = load_spec(str(spec_path))
-    ir = normalize_ir(raw_ir)
-
-    output_dir = tmp_path / "output"
-    generate_skeleton(ir, output_dir)
-
-    transform_file = output_dir / "apps" / "test_dataframe" / "transforms" / "transforms.py"
-    content = transform_file.read_text()
-
-    assert "import pandas as pd" in content, "pandas import missing"
-
-
-def test_check_function_has_correct_imports(sample_spec_with_models: Path, tmp_path: Path):
-    """Check関数が正しく生成されることを確認
-
-    Note: Check関数は payload: dict を受け取る設計なので、
-    特定のPydanticモデルのimportは不要。
-    """
-    # Spec読み込み
-    raw_ir = load_spec(str(sample_spec_with_models))
-    ir = normalize_ir(raw_ir)
-
-    # スケルトン生成
-    output_dir = tmp_path / "output"
-    generate_skeleton(ir, output_dir)
-
-    # 生成されたchecks.pyを確認
-    check_file = output_dir / "apps" / "test_imports" / "checks" / "checks.py"
-    assert check_file.exists(), f"Check file not found: {check_file}"
-
-    content = check_file.read_text()
-
-    # Check関数が生成されていることを確認
-    assert "def check_config(payload: dict) -> bool:" in content, "check_config function not found"
-
-
-def test_no_any_type_when_return_type_is_defined(tmp_path: Path):
-    """return_type_refが定義されている場合はAnyを使わないことを確認"""
-    spec_content = """
+_SPEC_ANY_TYPE = """
 version: "1"
 meta:
   name: "test-any-type"
@@ -233,39 +142,8 @@ transforms:
         datatype_ref: InputModel
     return_type_ref: StatusEnum
 """
-    spec_path = tmp_path / "spec.yaml"
-    spec_path.write_text(spec_content)
-
-    raw_ir = load_spec(str(spec_path))
-    ir = normalize_ir(raw_ir)
-
-    output_dir = tmp_path / "output"
-    generate_skeleton(ir, output_dir)
 
-    transform_file = output_dir / "apps" / "test_any_type" / "transforms" / "transforms.py"
-    content = transform_file.read_text()
-
-    # return_type_refが定義されている場合、Anyではなく正しい型が使われることを確認
-    assert "-> OutputModel:" in content, "OutputModel return type not found"
-    assert "-> StatusEnum:" in content, "StatusEnum return type not found"
-
-    # 以下のパターンでAnyが使われていないことを確認
-    # "-> Any:" のように、定義済みの型の代わりにAnyが使われていないか
-    lines = content.split("\n")
-    for line in lines:
-        if "def transform_with_pydantic" in line:
-            assert "-> OutputModel:" in line, (
-                f"transform_with_pydantic should return OutputModel, not Any. Line: {line}"
-            )
-            assert "-> Any:" not in line, f"transform_with_pydantic should not return Any. Line: {line}"
-        if "def transform_with_enum" in line:
-            assert "-> StatusEnum:" in line, f"transform_with_enum should return StatusEnum, not Any. Line: {line}"
-            assert "-> Any:" not in line, f"transform_with_enum should not return Any. Line: {line}"
-
-
-def test_no_any_type_in_parameters_when_types_defined(tmp_path: Path):
-    """パラメータの型が定義されている場合はAnyを使わないことを確認"""
-    spec_content = """
+_SPEC_PARAM_ANY = """
 version: "1"
 meta:
   name: "test-param-any"
@@ -306,35 +184,8 @@ transforms:
         datatype_ref: ModeEnum
     return_type_ref: ResultModel
 """
-    spec_path = tmp_path / "spec.yaml"
-    spec_path.write_text(spec_content)
-
-    raw_ir = load_spec(str(spec_path))
-    ir = normalize_ir(raw_ir)
-
-    output_dir = tmp_path / "output"
-    generate_skeleton(ir, output_dir)
-
-    transform_file = output_dir / "apps" / "test_param_any" / "transforms" / "transforms.py"
-    content = transform_file.read_text()
-
-    # パラメータの型が正しく設定されていることを確認
-    assert "config: ConfigModel" in content, "ConfigModel parameter type not found"
-    assert "mode: ModeEnum" in content, "ModeEnum parameter type not found"
 
-    # パラメータでAnyが使われていないことを確認
-    lines = content.split("\n")
-    for line in lines:
-        if "def process_data" in line:
-            assert "config: ConfigModel" in line, f"config should be ConfigModel, not Any. Line: {line}"
-            assert "mode: ModeEnum" in line, f"mode should be ModeEnum, not Any. Line: {line}"
-            assert "config: Any" not in line, f"config should not be Any. Line: {line}"
-            assert "mode: Any" not in line, f"mode should not be Any. Line: {line}"
-
-
-def test_generic_types_not_replaced_with_any(tmp_path: Path):
-    """Generic型（list、dict等）がAnyに置き換えられないことを確認"""
-    spec_content = """
+_SPEC_GENERIC_ANY = """
 version: "1"
 meta:
   name: "test-generic-any"
@@ -381,27 +232,138 @@ transforms:
         datatype_ref: IntDict
     return_type_ref: ResultModel
 """
-    spec_path = tmp_path / "spec.yaml"
-    spec_path.write_text(spec_content)
 
-    raw_ir = load_spec(str(spec_path))
-    ir = normalize_ir(raw_ir)
 
-    output_dir = tmp_path / "output"
-    generate_skeleton(ir, output_dir)
+# 生成ファイルの参照キー（テストごとにパスを組み立てない）
+_SAMPLE_TRANSFORMS_PATH = Path("apps/test_imports/transforms/transforms.py")
+_SAMPLE_CHECKS_PATH = Path("apps/test_imports/checks/checks.py")
+_DATAFRAME_TRANSFORMS_PATH = Path("apps/test_dataframe/transforms/transforms.py")
+
+# test_transform_has_correct_imports で期待するimport文
+_EXPECTED_IMPORTS_RE = re.compile(
+    r"from apps\.test_imports\.models\.(models import Config|models import Result|enums import Status)"
+)
+
+
+@pytest.fixture(scope="session")
+def sample_spec_with_models() -> SpecIR:
+    """Pydanticモデルを使用するspecを読み込み・正規化したIR（セッション内で共有）"""
+    return normalize_ir(load_spec_from_str(_SPEC_SAMPLE_MODELS))
+
+
+@pytest.fixture(scope="session")
+def generated_skeleton_for_sample(sample_spec_with_models: SpecIR, tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """sample_spec_with_models のスケルトンを1回だけ生成し、出力ディレクトリを共有"""
+    output_dir = tmp_path_factory.mktemp("skeleton_imports")
+    generate_skeleton(sample_spec_with_models, output_dir)
+    return output_dir
+
+
+def test_transform_has_correct_imports(generated_skeleton_for_sample: Path):
+    """Transform関数のimportが正しく生成されることを確認"""
+    # 生成されたtransforms.pyを確認
+    transform_file = generated_skeleton_for_sample / _SAMPLE_TRANSFORMS_PATH
+    assert transform_file.exists(), f"Transform file not found: {transform_file}"
 
-    transform_file = output_dir / "apps" / "test_generic_any" / "transforms" / "transforms.py"
     content = transform_file.read_text()
 
-    # Generic型が正しく表現されていることを確認（具体的な型は実装依存だが、Anyではないことを確認）
-    lines = content.split("\n")
-    for line in lines:
-        if "def process_list" in line:
-            # items パラメータがAnyではなく、list型として認識されていることを確認
-            assert "items:" in line, "items parameter should be defined"
-            # StringListまたはlist[str]のような型が期待される
-            # 少なくともAnyではないことを確認
-            assert "items: Any" not in line, f"items should not be Any. Line: {line}"
-        if "def process_dict" in line:
-            assert "mapping:" in line, "mapping parameter should be defined"
-            assert "mapping: Any" not in line, f"mapping should not be Any. Line: {line}"
+    # 必要なimportが含まれていることを確認（1回の走査でまとめて収集）
+    found = {m.group(1) for m in _EXPECTED_IMPORTS_RE.finditer(content)}
+    missing = {"models import Config", "models import Result", "enums import Status"} - found
+    assert not missing, f"Imports missing: {sorted(missing)}"
+
+
+def test_transform_has_correct_type_annotations(generated_skeleton_for_sample: Path):
+    """Transform関数の型アノテーションが正しく生成されることを確認"""
+    # 生成されたtransforms.pyを確認
+    content = (generated_skeleton_for_sample / _SAMPLE_TRANSFORMS_PATH).read_text()
+
+    # 型アノテーションが正しいことを確認
+    assert "def process_config(config: Config, status: Status) -> Result:" in content, (
+        "Function signature with correct types not found"
+    )
+    assert "-> Any:" not in content, "Any type should not be used when types are defined"
+
+
+def test_transform_with_dataframe_has_pandas_import(tmp_path: Path):
+    """DataFrame型を使用するtransformにpandasのimportが含まれることを確認"""
+    content = _gen_and_read(_SPEC_DATAFRAME, _DATAFRAME_TRANSFORMS_PATH, tmp_path)
+
+    assert "import pandas as pd" in content, "pandas import missing"
+
+
+def test_check_function_has_correct_imports(generated_skeleton_for_sample: Path):
+    """Check関数が正しく生成されることを確認
+
+    Note: Check関数は payload: dict を受け取る設計なので、
+    特定のPydanticモデルのimportは不要。
+    """
+    # 生成されたchecks.pyを確認
+    check_file = generated_skeleton_for_sample / _SAMPLE_CHECKS_PATH
+    assert check_file.exists(), f"Check file not found: {check_file}"
+
+    content = check_file.read_text()
+
+    # Check関数が生成されていることを確認
+    assert "def check_config(payload: dict) -> bool:" in content, "check_config function not found"
+
+
+def _gen_and_read(spec_content: str, transforms_path: Path, output_dir: Path) -> str:
+    """specからスケルトンを output_dir に生成し、transforms.py の内容を返す"""
+    generate_skeleton(normalize_ir(load_spec_from_str(spec_content)), output_dir)
+    return (output_dir / transforms_path).read_text()
+
+
+@pytest.mark.parametrize(
+    ("spec_yaml", "transforms_path", "expectations"),
+    [
+        # return_type_refが定義されている場合、Anyではなく正しい型が使われる
+        pytest.param(
+            _SPEC_ANY_TYPE,
+            Path("apps/test_any_type/transforms/transforms.py"),
+            {
+                "transform_with_pydantic": (("-> OutputModel:",), ("-> Any:",)),
+                "transform_with_enum": (("-> StatusEnum:",), ("-> Any:",)),
+            },
+            id="return_type_defined",
+        ),
+        # パラメータの型が定義されている場合、パラメータでAnyが使われない
+        pytest.param(
+            _SPEC_PARAM_ANY,
+            Path("apps/test_param_any/transforms/transforms.py"),
+            {
+                "process_data": (("config: ConfigModel", "mode: ModeEnum"), ("config: Any", "mode: Any")),
+            },
+            id="parameter_types_defined",
+        ),
+        # Generic型（list、dict等）がAnyに置き換えられない
+        # 具体的な型は実装依存（StringListまたはlist[str]など）だが、Anyではないことを確認
+        pytest.param(
+            _SPEC_GENERIC_ANY,
+            Path("apps/test_generic_any/transforms/transforms.py"),
+            {
+                "process_list": (("items:",), ("items: Any",)),
+                "process_dict": (("mapping:",), ("mapping: Any",)),
+            },
+            id="generic_types",
+        ),
+    ],
+)
+def test_no_any_type_when_types_defined(
+    spec_yaml: str,
+    transforms_path: Path,
+    expectations: dict[str, tuple[tuple[str, ...], tuple[str, ...]]],
+    tmp_path: Path,
+):
+    """型が定義されている場合、関数シグネチャでAnyが使われないことを確認"""
+    content = _gen_and_read(spec_yaml, transforms_path, tmp_path)
+
+    for func_name, (required, forbidden) in expectations.items():
+        # 関数シグネチャ行を直接検索（行リストを作らず、最初の一致で走査を打ち切る）
+        match = re.search(rf"^def {re.escape(func_name)}\(.*$", content, re.MULTILINE)
+        assert match, f"{func_name} not generated"
+        signature = match.group(0)
+        for fragment in required:
+            assert fragment in signature, f"{func_name} should contain '{fragment}', not Any. Line: {signature}"
+        for fragment in forbidden:
+            assert fragment not in signature, f"{func_name} should not contain '{fragment}'. Line: {signature}"
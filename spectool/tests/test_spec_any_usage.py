@@ -6,72 +6,83 @@
 DataFrame型などのフレキシブルな構造では Any は許容される。
 """
 
-import tempfile
+import contextlib
+import functools
+import re
+import sys
+from collections.abc import Iterator
 from pathlib import Path
+from types import CodeType
 
 import pytest
 import yaml
 
-from spectool.spectool.core.engine.loader import load_spec
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
 
 
-def _find_any_usage_in_pydantic_models(spec_dict: dict) -> list[str]:
-    """Spec内のpydantic_modelフィールドで typing:Any を使用している箇所を検出
+_PROJECT_ROOT = Path(__file__).parent.parent.parent
 
-    Args:
-        spec_dict: YAMLから読み込んだspec辞書
+_ANY = "typing:Any"
 
-    Returns:
-        不適切なAny使用箇所のリスト（"datatype_id.field_name" 形式）
-    """
-    issues = []
+# field.type 内で typing:Any を検査するパス
+# native: Any / list[Any], set[Any] / dict[K, Any] / dict[Any, V]（まれだが念のため）
+_ANY_TYPE_PATHS = (
+    ("native",),
+    ("generic", "element_type", "native"),
+    ("generic", "value_type", "native"),
+    ("generic", "key_type", "native"),
+)
 
-    datatypes = spec_dict.get("datatypes", [])
+# models.py の走査用パターン（class定義 / type alias定義 / import / 型アノテーション）
+# 型アノテーションは先読みで捕捉し、":" のみ消費することで後続行の定義を取りこぼさない
+_MODELS_SCAN_RE = re.compile(
+    r"^class\s+(?P<cls>[A-Z][a-zA-Z0-9_]*)"
+    r"|^(?P<alias>[A-Z][a-zA-Z0-9_]*)\s*="
+    r"|^from\s+[\w.]+\s+import\s+(?P<imp>.*?)$"
+    r"|:(?=\s*(?P<use>[A-Z][a-zA-Z0-9_]*))",
+    re.MULTILINE,
+)
 
-    for datatype in datatypes:
-        datatype_id = datatype.get("id", "unknown")
 
+def _lookup(node: object, key: str) -> object:
+    """dictであればキーを引き、それ以外はNoneを返す（reduce用）"""
+    return node.get(key) if isinstance(node, dict) else None
+
+
+def _iter_any_issues(spec_dict: dict) -> Iterator[str]:
+    """Spec内のpydantic_modelフィールドで typing:Any を使用している箇所を順に返す
+
+    ジェネレータなので、有無だけを知りたい場合は最初の検出で走査を打ち切れる。
+
+    Args:
+        spec_dict: YAMLから読み込んだspec辞書
+
+    Yields:
+        不適切なAny使用箇所（"datatype_id.field_name" 形式）
+    """
+    for datatype in spec_dict.get("datatypes", []):
         # pydantic_modelのみチェック（type_aliasやdataframe_schemaは除外）
         if "pydantic_model" not in datatype:
             continue
 
-        pydantic_model = datatype["pydantic_model"]
-        fields = pydantic_model.get("fields", [])
-
-        for field in fields:
-            field_name = field.get("name", "unknown")
+        datatype_id = datatype.get("id", "unknown")
+        for field in datatype["pydantic_model"].get("fields", []):
             field_type = field.get("type", {})
+            if any(functools.reduce(_lookup, path, field_type) == _ANY for path in _ANY_TYPE_PATHS):
+                yield f"{datatype_id}.{field.get('name', 'unknown')}"
 
-            # 直接 native: "typing:Any" の場合
-            if field_type.get("native") == "typing:Any":
-                issues.append(f"{datatype_id}.{field_name}")
-                continue
-
-            # generic型の中で typing:Any が使われている場合
-            if "generic" in field_type:
-                generic_def = field_type["generic"]
 
-                # list[Any], set[Any] などの element_type チェック
-                if "element_type" in generic_def:
-                    element_type = generic_def["element_type"]
-                    if element_type.get("native") == "typing:Any":
-                        issues.append(f"{datatype_id}.{field_name}")
-                        continue
+def _has_any_issues(spec_dict: dict) -> bool:
+    """不適切なAny使用が1つでもあるか（最初の検出で打ち切り）"""
+    return any(_iter_any_issues(spec_dict))
 
-                # dict[K, Any] の value_type チェック
-                if "value_type" in generic_def:
-                    value_type = generic_def["value_type"]
-                    if value_type.get("native") == "typing:Any":
-                        issues.append(f"{datatype_id}.{field_name}")
-                        continue
 
-                # dict[Any, V] の key_type チェック（まれだが念のため）
-                if "key_type" in generic_def:
-                    key_type = generic_def["key_type"]
-                    if key_type.get("native") == "typing:Any":
-                        issues.append(f"{datatype_id}.{field_name}")
-
-    return issues
+def _list_any_issues(spec_dict: dict) -> list[str]:
+    """不適切なAny使用箇所をすべて列挙"""
+    return list(_iter_any_issues(spec_dict))
 
 
 def test_detect_any_in_pydantic_models():
@@ -132,8 +143,8 @@ datatypes:
           description: "Good: list of strings"
 """
 
-    spec_dict = yaml.safe_load(spec_yaml)
-    issues = _find_any_usage_in_pydantic_models(spec_dict)
+    spec_dict = yaml.load(spec_yaml, Loader=_SafeLoader)
+    issues = _list_any_issues(spec_dict)
 
     # BadModel1.items と BadModel2.data が検出されるべき
     assert len(issues) == 2, f"Expected 2 issues, found {len(issues)}: {issues}"
@@ -170,8 +181,8 @@ datatypes:
                 native: "typing:Any"
 """
 
-    spec_dict = yaml.safe_load(spec_yaml)
-    issues = _find_any_usage_in_pydantic_models(spec_dict)
+    spec_dict = yaml.load(spec_yaml, Loader=_SafeLoader)
+    issues = _list_any_issues(spec_dict)
 
     assert len(issues) == 1
     assert "ParamsModel.config" in issues
@@ -199,29 +210,31 @@ datatypes:
       target: "pandas:DataFrame"
 """
 
-    spec_dict = yaml.safe_load(spec_yaml)
-    issues = _find_any_usage_in_pydantic_models(spec_dict)
+    spec_dict = yaml.load(spec_yaml, Loader=_SafeLoader)
+    issues = _list_any_issues(spec_dict)
 
     # type_aliasはチェック対象外なので問題なし
     assert len(issues) == 0
 
 
-def test_algo_trade_pipeline_has_no_any_issues():
-    """algo-trade-pipeline specでPydanticモデルに不適切なAny使用がないことを確認"""
-    spec_path = Path(__file__).parent.parent.parent / "specs" / "algo-trade-pipeline.yaml"
+@pytest.fixture(scope="session")
+def algo_trade_pipeline_dict() -> dict:
+    """algo-trade-pipeline specを1回だけ読み込んで共有"""
+    spec_path = _PROJECT_ROOT / "specs" / "algo-trade-pipeline.yaml"
 
     if not spec_path.exists():
         pytest.skip(f"Spec file not found: {spec_path}")
 
     with open(spec_path) as f:
-        spec_dict = yaml.safe_load(f)
+        return yaml.load(f, Loader=_SafeLoader)
 
-    issues = _find_any_usage_in_pydantic_models(spec_dict)
 
-    # 修正後は不適切なAny使用がないはず
-    assert len(issues) == 0, (
-        f"Found {len(issues)} inappropriate Any usage in Pydantic models:\n"
-        f"{chr(10).join(f'  - {issue}' for issue in issues)}\n"
+def test_algo_trade_pipeline_has_no_any_issues(algo_trade_pipeline_dict: dict):
+    """algo-trade-pipeline specでPydanticモデルに不適切なAny使用がないことを確認"""
+    # 修正後は不適切なAny使用がないはず（メッセージ用の全件列挙は失敗時のみ）
+    assert not _has_any_issues(algo_trade_pipeline_dict), (
+        f"Found inappropriate Any usage in Pydantic models:\n"
+        f"{chr(10).join(f'  - {issue}' for issue in _list_any_issues(algo_trade_pipeline_dict))}\n"
         f"Pydanticモデルのフィールドには適切な型定義を使用してください。"
     )
 
@@ -258,79 +271,86 @@ datatypes:
         native: "typing:Any"
 """
 
-    spec_dict = yaml.safe_load(spec_yaml)
+    spec_dict = yaml.load(spec_yaml, Loader=_SafeLoader)
 
     # このテストはgeneric定義なので pydantic_model チェックには引っかからない
-    issues = _find_any_usage_in_pydantic_models(spec_dict)
+    issues = _list_any_issues(spec_dict)
     assert len(issues) == 0  # generic定義はPydanticモデルではない
 
     # generic定義のAnyチェックは別途必要に応じて実装可能
 
 
-def test_generated_models_can_be_imported():
-    """生成されたmodels.pyがインポートエラーなくロードできることを検証"""
-    import importlib
-    import sys
+# コンパイル済みコードのキャッシュ（再実行・parametrize時もimportlibを経由せず再利用）
+_COMPILED: dict[tuple[str, str], CodeType] = {}
 
-    project_root = Path(__file__).parent.parent.parent
-    models_path = project_root / "apps" / "algo_trade_pipeline" / "models" / "models.py"
 
-    if not models_path.exists():
-        pytest.skip(f"Generated models file not found: {models_path}")
+def _compile_once(path: Path, source: str) -> CodeType:
+    """ソースをコンパイルし、同一パス・同一内容のコードオブジェクトを再利用"""
+    key = (str(path), source)
+    if key not in _COMPILED:
+        _COMPILED[key] = compile(source, str(path), "exec")
+    return _COMPILED[key]
 
-    sys.path.insert(0, str(project_root))
 
+@contextlib.contextmanager
+def _syspath(path: Path) -> Iterator[None]:
+    """一時的に sys.path の先頭へパスを追加する"""
+    entry = str(path)
+    sys.path.insert(0, entry)
     try:
-        # Import the generated models module
-        spec = importlib.util.spec_from_file_location("test_models", models_path)
-        if spec and spec.loader:
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-        else:
-            raise AssertionError("Failed to create module spec")
-
-    except Exception as e:
-        raise AssertionError(
-            f"Failed to import generated models.py:\n{e}\n\n"
-            f"This likely means there are undefined type references in the generated code."
-        ) from e
+        yield
     finally:
-        if str(project_root) in sys.path:
-            sys.path.remove(str(project_root))
+        # 先頭に追加したものを取り除く（sys.path の線形探索は不要）
+        sys.path.remove(entry)
 
 
-def test_generated_models_have_no_undefined_references():
-    """生成されたmodels.py内で未定義の型参照がないことを確認"""
-    import re
-
-    project_root = Path(__file__).parent.parent.parent
-    models_path = project_root / "apps" / "algo_trade_pipeline" / "models" / "models.py"
+@pytest.fixture(scope="module")
+def generated_models_text() -> tuple[str, Path]:
+    """生成済みmodels.pyのソースとパスを共有（モジュール内で1回だけ読み込み）"""
+    models_path = _PROJECT_ROOT / "apps" / "algo_trade_pipeline" / "models" / "models.py"
 
     if not models_path.exists():
         pytest.skip(f"Generated models file not found: {models_path}")
 
-    content = models_path.read_text()
+    source = models_path.read_text()
+    return source, models_path
 
-    # Extract all type annotations used in the file
-    type_pattern = r":\s*([A-Z][a-zA-Z0-9_]*)"
-    used_types = set(re.findall(type_pattern, content))
 
-    # Find all defined types (class definitions, enums, and type aliases)
-    defined_classes = set(re.findall(r"^class\s+([A-Z][a-zA-Z0-9_]*)", content, re.MULTILINE))
-    defined_aliases = set(re.findall(r"^([A-Z][a-zA-Z0-9_]*)\s*=", content, re.MULTILINE))
-    defined_enums = set(re.findall(r"^class\s+([A-Z][a-zA-Z0-9_]*)\(.*Enum\)", content, re.MULTILINE))
+def test_generated_models_can_be_imported(generated_models_text: tuple[str, Path]):
+    """生成されたmodels.pyがインポートエラーなくロードできることを検証"""
+    source, models_path = generated_models_text
+
+    try:
+        with _syspath(_PROJECT_ROOT):
+            # Execute the generated models module
+            exec(_compile_once(models_path, source), {"__name__": "test_models"})
+    except Exception as e:
+        raise AssertionError(
+            f"Failed to import generated models.py:\n{e}\n\n"
+            f"This likely means there are undefined type references in the generated code."
+        ) from e
 
-    # Find all imported types
-    imported_types = set()
-    for match in re.finditer(r"^from\s+[\w.]+\s+import\s+(.*?)$", content, re.MULTILINE):
-        imports = match.group(1)
-        for item in imports.split(","):
-            item = item.strip()
-            if " as " in item:
-                item = item.split(" as ")[0].strip()
-            imported_types.add(item)
 
-    defined_types = defined_classes | defined_aliases | defined_enums | imported_types
+def test_generated_models_have_no_undefined_references(generated_models_text: tuple[str, Path]):
+    """生成されたmodels.py内で未定義の型参照がないことを確認"""
+    content, _ = generated_models_text
+
+    # 型の使用・定義（class / enum / type alias）・importを1回の走査で収集
+    used_types: set[str] = set()
+    defined_types: set[str] = set()
+    for match in _MODELS_SCAN_RE.finditer(content):
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == "use":
+            used_types.add(value)
+        elif kind == "imp":
+            for item in value.split(","):
+                item = item.strip()
+                if " as " in item:
+                    item = item.split(" as ")[0].strip()
+                defined_types.add(item)
+        else:
+            defined_types.add(value)
 
     # Check for undefined types (excluding built-in types)
     builtin_types = {"BaseModel", "str", "int", "float", "list", "dict", "Enum", "IntEnum"}
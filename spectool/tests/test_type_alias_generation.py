@@ -3,8 +3,7 @@
 type_alias (simple/tuple) と generic (list) の定義が正しくコード生成されることを確認する。
 """
 
-from pathlib import Path
-import tempfile
+import json
 import pytest
 
 from spectool.spectool.core.engine.loader import load_spec
@@ -12,140 +11,154 @@ from spectool.spectool.core.engine.normalizer import normalize_ir
 from spectool.spectool.backends.py_skeleton import generate_skeleton
 
 
-@pytest.fixture
-def temp_project_dir():
-    """一時プロジェクトディレクトリ"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
-
-
-@pytest.fixture
-def type_alias_spec(temp_project_dir):
-    """type_alias定義を含むspec"""
-    spec_yaml = """
-version: "1.0"
-meta:
-  name: test_type_alias
-  description: "Test spec with type_alias and generic"
-
-checks:
-  - id: check_simple_frame
-    description: "Check simple dataframe"
-    impl: "apps.checks:check_simple_frame"
-    file_path: "apps/checks/validators.py"
-
-  - id: check_tuple_data
-    description: "Check tuple data"
-    impl: "apps.checks:check_tuple_data"
-    file_path: "apps/checks/validators.py"
-
-  - id: check_list_data
-    description: "Check list data"
-    impl: "apps.checks:check_list_data"
-    file_path: "apps/checks/validators.py"
-
-datatypes:
-  # DataFrame型
-  - id: OHLCVFrame
-    description: "OHLCV DataFrame"
-    dataframe_schema:
-      index:
-        name: timestamp
-        dtype: datetime
-        nullable: false
-      columns:
-        - name: close
-          dtype: float
-          nullable: false
-
-  # Simple type_alias (DataFrameエイリアス)
-  - id: MultiAssetFrame
-    description: "Multi-asset DataFrame (type_alias: simple)"
-    check_functions:
-      - check_simple_frame
-    type_alias:
-      type: simple
-      target: "pandas:DataFrame"
-
-  # Tuple type_alias
-  - id: FeatureTargetTuple
-    description: "Feature and Target tuple (type_alias: tuple)"
-    check_functions:
-      - check_tuple_data
-    type_alias:
-      type: tuple
-      elements:
-        - datatype_ref: OHLCVFrame
-        - datatype_ref: OHLCVFrame
-
-  # Pydantic model
-  - id: DataPoint
-    description: "Single data point"
-    pydantic_model:
-      fields:
-        - name: value
-          type:
-            native: "builtins:float"
-          required: true
-
-  # Generic list
-  - id: DataPointList
-    description: "List of data points (generic: list)"
-    check_functions:
-      - check_list_data
-    generic:
-      container: list
-      element_type:
-        datatype_ref: DataPoint
-
-transforms:
-  - id: process_multi_asset
-    description: "Process multi-asset frame"
-    impl: "apps.transforms:process_multi_asset"
-    file_path: "apps/transforms/processors.py"
-    parameters:
-      - name: data
-        datatype_ref: MultiAssetFrame
-    return_datatype_ref: MultiAssetFrame
-
-  - id: align_features
-    description: "Align features and targets"
-    impl: "apps.transforms:align_features"
-    file_path: "apps/transforms/processors.py"
-    parameters:
-      - name: data1
-        datatype_ref: OHLCVFrame
-      - name: data2
-        datatype_ref: OHLCVFrame
-    return_datatype_ref: FeatureTargetTuple
-
-  - id: aggregate_points
-    description: "Aggregate data points"
-    impl: "apps.transforms:aggregate_points"
-    file_path: "apps/transforms/processors.py"
-    parameters:
-      - name: points
-        datatype_ref: DataPointList
-    return_native: "builtins:float"
-"""
-    spec_path = temp_project_dir / "test_spec.yaml"
-    spec_path.write_text(spec_yaml)
+# type_alias / generic 定義を含むspec
+_TYPE_ALIAS_SPEC = {
+    "version": "1.0",
+    "meta": {"name": "test_type_alias", "description": "Test spec with type_alias and generic"},
+    "checks": [
+        {
+            "id": "check_simple_frame",
+            "description": "Check simple dataframe",
+            "impl": "apps.checks:check_simple_frame",
+            "file_path": "apps/checks/validators.py",
+        },
+        {
+            "id": "check_tuple_data",
+            "description": "Check tuple data",
+            "impl": "apps.checks:check_tuple_data",
+            "file_path": "apps/checks/validators.py",
+        },
+        {
+            "id": "check_list_data",
+            "description": "Check list data",
+            "impl": "apps.checks:check_list_data",
+            "file_path": "apps/checks/validators.py",
+        },
+    ],
+    "datatypes": [
+        # DataFrame型
+        {
+            "id": "OHLCVFrame",
+            "description": "OHLCV DataFrame",
+            "dataframe_schema": {
+                "index": {"name": "timestamp", "dtype": "datetime", "nullable": False},
+                "columns": [{"name": "close", "dtype": "float", "nullable": False}],
+            },
+        },
+        # Simple type_alias (DataFrameエイリアス)
+        {
+            "id": "MultiAssetFrame",
+            "description": "Multi-asset DataFrame (type_alias: simple)",
+            "check_functions": ["check_simple_frame"],
+            "type_alias": {"type": "simple", "target": "pandas:DataFrame"},
+        },
+        # Tuple type_alias
+        {
+            "id": "FeatureTargetTuple",
+            "description": "Feature and Target tuple (type_alias: tuple)",
+            "check_functions": ["check_tuple_data"],
+            "type_alias": {
+                "type": "tuple",
+                "elements": [{"datatype_ref": "OHLCVFrame"}, {"datatype_ref": "OHLCVFrame"}],
+            },
+        },
+        # Pydantic model
+        {
+            "id": "DataPoint",
+            "description": "Single data point",
+            "pydantic_model": {
+                "fields": [{"name": "value", "type": {"native": "builtins:float"}, "required": True}],
+            },
+        },
+        # Generic list
+        {
+            "id": "DataPointList",
+            "description": "List of data points (generic: list)",
+            "check_functions": ["check_list_data"],
+            "generic": {"container": "list", "element_type": {"datatype_ref": "DataPoint"}},
+        },
+    ],
+    "transforms": [
+        {
+            "id": "process_multi_asset",
+            "description": "Process multi-asset frame",
+            "impl": "apps.transforms:process_multi_asset",
+            "file_path": "apps/transforms/processors.py",
+            "parameters": [{"name": "data", "datatype_ref": "MultiAssetFrame"}],
+            "return_datatype_ref": "MultiAssetFrame",
+        },
+        {
+            "id": "align_features",
+            "description": "Align features and targets",
+            "impl": "apps.transforms:align_features",
+            "file_path": "apps/transforms/processors.py",
+            "parameters": [
+                {"name": "data1", "datatype_ref": "OHLCVFrame"},
+                {"name": "data2", "datatype_ref": "OHLCVFrame"},
+            ],
+            "return_datatype_ref": "FeatureTargetTuple",
+        },
+        {
+            "id": "aggregate_points",
+            "description": "Aggregate data points",
+            "impl": "apps.transforms:aggregate_points",
+            "file_path": "apps/transforms/processors.py",
+            "parameters": [{"name": "points", "datatype_ref": "DataPointList"}],
+            "return_native": "builtins:float",
+        },
+    ],
+}
+
+
+@pytest.fixture(scope="module")
+def temp_project_root(tmp_path_factory):
+    """モジュール内で共有する一時ディレクトリ（作成はモジュールごとに1回）"""
+    return tmp_path_factory.mktemp("type_alias")
+
+
+@pytest.fixture(scope="module")
+def type_alias_spec(temp_project_root):
+    """type_alias定義を含むspecファイル（モジュール内で1回だけ書き出す）
+
+    loaderは.jsonも読めるので、PyYAMLのダンパーではなく標準のjsonで書き出す。
+    """
+    spec_path = temp_project_root / "test_spec.json"
+    spec_path.write_text(json.dumps(_TYPE_ALIAS_SPEC))
     return spec_path
 
 
-def test_type_alias_simple_generated_in_types_py(temp_project_dir, type_alias_spec):
-    """Simple type_alias が types.py に生成されること"""
-    # Load and generate
-    ir = load_spec(str(type_alias_spec))
-    normalized = normalize_ir(ir)
-    generate_skeleton(normalized, temp_project_dir)
+@pytest.fixture(scope="module")
+def type_alias_ir(type_alias_spec):
+    """spec を読み込み・正規化したIR（モジュール内で1回だけ作る）"""
+    return normalize_ir(load_spec(str(type_alias_spec)))
+
+
+@pytest.fixture(scope="module")
+def generated_skeleton(temp_project_root, type_alias_ir):
+    """スケルトンをモジュール内で1回だけ生成し、アプリのディレクトリを返す"""
+    generate_skeleton(type_alias_ir, temp_project_root)
+    return temp_project_root / "apps" / "test_type_alias"
 
-    # Check types.py exists
-    types_file = temp_project_dir / "apps" / "test_type_alias" / "types.py"
+
+@pytest.fixture(scope="module")
+def types_content(generated_skeleton):
+    """生成された types.py の内容（モジュール内で1回だけ読む）"""
+    types_file = generated_skeleton / "types.py"
     assert types_file.exists(), "types.py should be generated"
+    return types_file.read_text()
+
 
-    # Read types.py content
-    content = types_file.read_text()
+@pytest.fixture(scope="module")
+def transforms_content(generated_skeleton):
+    """生成された transforms/processors.py の内容（モジュール内で1回だけ読む）"""
+    transform_file = generated_skeleton / "transforms" / "processors.py"
+    assert transform_file.exists(), "Transform file should be generated"
+    return transform_file.read_text()
+
+
+def test_type_alias_simple_generated_in_types_py(types_content):
+    """Simple type_alias が types.py に生成されること"""
+    content = types_content
 
     # Should contain MultiAssetFrame TypeAlias
     assert "MultiAssetFrame" in content, "MultiAssetFrame TypeAlias should be generated"
@@ -157,16 +170,9 @@ def test_type_alias_simple_generated_in_types_py(temp_project_dir, type_alias_sp
     assert "check_simple_frame" in content, "Should reference check function"
 
 
-def test_type_alias_tuple_generated_in_types_py(temp_project_dir, type_alias_spec):
+def test_type_alias_tuple_generated_in_types_py(types_content):
     """Tuple type_alias が types.py に生成されること"""
-    # Load and generate
-    ir = load_spec(str(type_alias_spec))
-    normalized = normalize_ir(ir)
-    generate_skeleton(normalized, temp_project_dir)
-
-    # Check types.py
-    types_file = temp_project_dir / "apps" / "test_type_alias" / "types.py"
-    content = types_file.read_text()
+    content = types_content
 
     # Should contain FeatureTargetTuple TypeAlias
     assert "FeatureTargetTuple" in content, "FeatureTargetTuple TypeAlias should be generated"
@@ -174,16 +180,9 @@ def test_type_alias_tuple_generated_in_types_py(temp_project_dir, type_alias_spe
     assert "OHLCVFrame" in content, "Should reference element types"
 
 
-def test_generic_list_generated_in_types_py(temp_project_dir, type_alias_spec):
+def test_generic_list_generated_in_types_py(types_content):
     """Generic list が types.py に生成されること"""
-    # Load and generate
-    ir = load_spec(str(type_alias_spec))
-    normalized = normalize_ir(ir)
-    generate_skeleton(normalized, temp_project_dir)
-
-    # Check types.py
-    types_file = temp_project_dir / "apps" / "test_type_alias" / "types.py"
-    content = types_file.read_text()
+    content = types_content
 
     # Should contain DataPointList TypeAlias
     assert "DataPointList" in content, "DataPointList TypeAlias should be generated"
@@ -191,18 +190,9 @@ def test_generic_list_generated_in_types_py(temp_project_dir, type_alias_spec):
     assert "DataPoint" in content, "Should reference element type"
 
 
-def test_transforms_can_import_type_aliases(temp_project_dir, type_alias_spec):
+def test_transforms_can_import_type_aliases(transforms_content):
     """生成されたtransform関数がtype_aliasをimportできること"""
-    # Load and generate
-    ir = load_spec(str(type_alias_spec))
-    normalized = normalize_ir(ir)
-    generate_skeleton(normalized, temp_project_dir)
-
-    # Check transform file
-    transform_file = temp_project_dir / "apps" / "test_type_alias" / "transforms" / "processors.py"
-    assert transform_file.exists(), "Transform file should be generated"
-
-    content = transform_file.read_text()
+    content = transforms_content
 
     # Should import MultiAssetFrame from types
     assert "from apps.test_type_alias.types import" in content, "Should import from types module"
@@ -211,8 +201,9 @@ def test_transforms_can_import_type_aliases(temp_project_dir, type_alias_spec):
     assert "DataPointList" in content, "Should import DataPointList"
 
 
-def test_type_alias_ir_loaded_correctly(temp_project_dir, type_alias_spec):
+def test_type_alias_ir_loaded_correctly(type_alias_spec):
     """type_alias と generic が IR に正しくロードされること"""
+    # 正規化前のloaderの結果を確認するため、正規化済みの type_alias_ir は使わない
     ir = load_spec(str(type_alias_spec))
 
     # Check type_aliases are loaded
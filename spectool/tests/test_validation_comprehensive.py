@@ -4,23 +4,18 @@
 一部のエラーで全体が停止しないことが重要。
 """
 
-from pathlib import Path
-import tempfile
+import re
+
 import pytest
-import yaml
 
 from spectool.spectool.core.engine.loader import load_spec
-from spectool.spectool.core.engine.validate import validate_spec
 
 
-@pytest.fixture
-def temp_spec_dir():
-    """一時specディレクトリ"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+# エラーメッセージにデータ型IDまたはフィールド名が含まれるか（大文字小文字を区別せず1回の走査で判定）
+_DATATYPE_ID_TOKENS = re.compile(r"testframe|idx", re.IGNORECASE)
 
 
-def test_validation_returns_all_errors_not_exception(temp_spec_dir):
+def test_validation_returns_all_errors_not_exception(cached_validate_spec):
     """複数のエラーがある場合、すべてのエラーがリストで返されることを確認（例外を投げない）"""
     spec_data = {
         "version": "1.0",
@@ -54,12 +49,8 @@ def test_validation_returns_all_errors_not_exception(temp_spec_dir):
         ],
     }
 
-    spec_path = temp_spec_dir / "spec.yaml"
-    with open(spec_path, "w") as f:
-        yaml.dump(spec_data, f)
-
     # バリデーション実行（例外を投げずにエラーリストを返すべき）
-    result = validate_spec(str(spec_path))
+    result = cached_validate_spec(spec_data)
 
     # 3層構造が返されること
     assert isinstance(result, dict)
@@ -79,7 +70,7 @@ def test_validation_returns_all_errors_not_exception(temp_spec_dir):
     assert "checks" in errors or "check_definitions" in errors
 
 
-def test_validation_shows_warnings_and_successes(temp_spec_dir):
+def test_validation_shows_warnings_and_successes(cached_validate_spec):
     """一部にエラーがあっても、警告や成功した項目も表示されることを確認"""
     spec_data = {
         "version": "1.0",
@@ -111,11 +102,7 @@ def test_validation_shows_warnings_and_successes(temp_spec_dir):
         ],
     }
 
-    spec_path = temp_spec_dir / "spec.yaml"
-    with open(spec_path, "w") as f:
-        yaml.dump(spec_data, f)
-
-    result = validate_spec(str(spec_path))
+    result = cached_validate_spec(spec_data)
     errors = result["errors"]
     warnings = result["warnings"]
     successes = result["successes"]
@@ -133,7 +120,7 @@ def test_validation_shows_warnings_and_successes(temp_spec_dir):
     assert result is not None
 
 
-def test_validation_error_messages_are_descriptive(temp_spec_dir):
+def test_validation_error_messages_are_descriptive(cached_validate_spec):
     """バリデーションエラーメッセージが詳細であることを確認"""
     spec_data = {
         "version": "1.0",
@@ -149,28 +136,20 @@ def test_validation_error_messages_are_descriptive(temp_spec_dir):
         ],
     }
 
-    spec_path = temp_spec_dir / "spec.yaml"
-    with open(spec_path, "w") as f:
-        yaml.dump(spec_data, f)
-
-    result = validate_spec(str(spec_path))
+    result = cached_validate_spec(spec_data)
     errors = result["errors"]
 
     # エラーメッセージに以下の情報が含まれることを確認
     # - データ型ID
     # - 問題のフィールド
     # - 期待される値
-    all_error_messages = []
-    for category_errors in errors.values():
-        all_error_messages.extend(category_errors)
-
-    combined_errors = " ".join(all_error_messages).lower()
+    combined_errors = " ".join(msg for errs in errors.values() for msg in errs)
 
     # データ型IDが含まれているか
-    assert "testframe" in combined_errors or "idx" in combined_errors
+    assert _DATATYPE_ID_TOKENS.search(combined_errors)
 
 
-def test_validation_continues_after_first_error(temp_spec_dir):
+def test_validation_continues_after_first_error(cached_validate_spec):
     """最初のエラー後も検証が継続されることを確認"""
     spec_data = {
         "version": "1.0",
@@ -202,11 +181,7 @@ def test_validation_continues_after_first_error(temp_spec_dir):
         ],
     }
 
-    spec_path = temp_spec_dir / "spec.yaml"
-    with open(spec_path, "w") as f:
-        yaml.dump(spec_data, f)
-
-    result = validate_spec(str(spec_path))
+    result = cached_validate_spec(spec_data)
     errors = result["errors"]
 
     # 複数のエラーが報告されること（最初のエラーで停止していない）
@@ -214,7 +189,7 @@ def test_validation_continues_after_first_error(temp_spec_dir):
     assert total_errors >= 2, "Validation should report multiple errors, not stop at the first one"
 
 
-def test_validation_categorizes_errors_by_type(temp_spec_dir):
+def test_validation_categorizes_errors_by_type(cached_validate_spec):
     """エラーが種類別にカテゴライズされて返されることを確認"""
     spec_data = {
         "version": "1.0",
@@ -250,11 +225,7 @@ def test_validation_categorizes_errors_by_type(temp_spec_dir):
         ],
     }
 
-    spec_path = temp_spec_dir / "spec.yaml"
-    with open(spec_path, "w") as f:
-        yaml.dump(spec_data, f)
-
-    result = validate_spec(str(spec_path))
+    result = cached_validate_spec(spec_data)
     errors = result["errors"]
 
     # エラーがカテゴリ別に分類されていること
@@ -266,7 +237,7 @@ def test_validation_categorizes_errors_by_type(temp_spec_dir):
     assert len(categories_with_errors) >= 2, "Errors should be categorized by type"
 
 
-def test_validation_summary_includes_counts(temp_spec_dir):
+def test_validation_summary_includes_counts(cached_validate_spec):
     """バリデーション結果にエラー/警告/成功の件数が含まれることを確認"""
     spec_data = {
         "version": "1.0",
@@ -289,11 +260,7 @@ def test_validation_summary_includes_counts(temp_spec_dir):
         ],
     }
 
-    spec_path = temp_spec_dir / "spec.yaml"
-    with open(spec_path, "w") as f:
-        yaml.dump(spec_data, f)
-
-    result = validate_spec(str(spec_path))
+    result = cached_validate_spec(spec_data)
 
     # 3層構造が返されること
     assert isinstance(result, dict)
@@ -321,7 +288,7 @@ def test_validation_summary_includes_counts(temp_spec_dir):
     print(f"Errors: {total_errors}, Warnings: {total_warnings}, Successes: {total_successes}")
 
 
-def test_validation_handles_circular_dependencies_gracefully(temp_spec_dir):
+def test_validation_handles_circular_dependencies_gracefully(cached_validate_spec):
     """循環依存がある場合も、他の検証項目は継続されることを確認"""
     spec_data = {
         "version": "1.0",
@@ -373,13 +340,9 @@ def test_validation_handles_circular_dependencies_gracefully(temp_spec_dir):
     # （実際の循環依存チェックは別の場所で行われる可能性があるが、
     # ここではバリデーションが例外を投げずに完了することを確認）
 
-    spec_path = temp_spec_dir / "spec.yaml"
-    with open(spec_path, "w") as f:
-        yaml.dump(spec_data, f)
-
     # バリデーション実行（例外を投げない）
     try:
-        result = validate_spec(str(spec_path))
+        result = cached_validate_spec(spec_data)
         assert result is not None
         assert "errors" in result
         assert "warnings" in result
@@ -3,49 +3,187 @@
 重要なバリデーションルールが正しく動作することを確認する。
 """
 
-from pathlib import Path
-import tempfile
+import copy
+
 import pytest
-import yaml
 
 from spectool.spectool.core.engine.loader import load_spec
-from spectool.spectool.core.engine.validate import validate_spec
-
 
-@pytest.fixture
-def temp_spec_dir():
-    """一時specディレクトリ"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
 
-
-def test_dag_stage_with_zero_transform_candidates_detected(temp_spec_dir):
+# 各テストで共通のdataframe_schema（カラム名・dtypeのみテストごとに差し替える）
+_FRAME_SCHEMA_TEMPLATE = {
+    "index": {"name": "idx", "dtype": "int"},
+    "columns": [{"name": "value", "dtype": "float"}],
+}
+
+
+def _make_datatype(id_: str, col_name: str, col_dtype: str = "float", **fields) -> dict:
+    """共通テンプレートからカラムを1つ持つDataFrame型のdatatype定義を作る"""
+    schema = copy.deepcopy(_FRAME_SCHEMA_TEMPLATE)
+    schema["columns"][0].update(name=col_name, dtype=col_dtype)
+    return {"id": id_, "dataframe_schema": schema, **fields}
+
+
+def _collect_lower(*categorized: dict[str, list[str]]) -> list[str]:
+    """カテゴリ別のエラー/警告メッセージを1回の走査で小文字化して平坦化する"""
+    return [msg.lower() for group in categorized for msgs in group.values() for msg in msgs]
+
+
+def _contains_any(messages: list[str], *substrings: str) -> bool:
+    """いずれかのメッセージがいずれかの部分文字列を含むか（見つかった時点で打ち切る）"""
+    return any(sub in msg for msg in messages for sub in substrings)
+
+
+# check関数がゼロ件のDataType（UnvalidatedFrame）を含むspec
+_SPEC_ZERO_CHECKS = {
+    "version": "1.0",
+    "meta": {"name": "zero-checks_spec"},
+    "datatypes": [
+        _make_datatype(
+            "ValidatedFrame",
+            "value",
+            description="Frame with checks",
+            check_functions=["apps.checks:check_validated"],  # checkあり
+        ),
+        _make_datatype(
+            "UnvalidatedFrame",
+            "result",
+            description="Frame without checks",
+            # check_functionsなし（エラーまたは警告）
+        ),
+    ],
+    "checks": [
+        {
+            "id": "check_validated",
+            "description": "Validation check",
+            "impl": "apps.checks:check_validated",
+            "file_path": "checks/validated.py",
+        }
+    ],
+}
+
+
+# example/generatorの両方がゼロ件のDataType（FrameWithNeither）を含むspec
+_SPEC_ZERO_EXAMPLES_GENERATORS = {
+    "version": "1.0",
+    "meta": {"name": "zero-examples-generators_spec"},
+    "datatypes": [
+        _make_datatype(
+            "FrameWithExample",
+            "value",
+            description="Frame with example",
+        ),
+        _make_datatype(
+            "FrameWithGenerator",
+            "result",
+            description="Frame with generator",
+            generator_factory="apps.generators:generate_frame",  # generatorあり
+        ),
+        _make_datatype(
+            "FrameWithNeither",
+            "other",
+            "str",
+            description="Frame without example or generator",
+            # exampleもgeneratorもなし（エラーまたは警告）
+        ),
+    ],
+    "examples": [
+        {
+            "id": "example_1",
+            "description": "Example for FrameWithExample",
+            "datatype_ref": "FrameWithExample",
+            "input": {"idx": [1], "value": [10.0]},
+        }
+    ],
+    "generators": [
+        {
+            "id": "generate_frame",
+            "description": "Generator for FrameWithGenerator",
+            "impl": "apps.generators:generate_frame",
+            "file_path": "generators/generators.py",
+            "parameters": [],
+            "return_type_ref": "FrameWithGenerator",
+        }
+    ],
+}
+
+
+# check/example/generatorの3つすべてがゼロのDataType（IncompleteFrame）を含むspec
+_SPEC_INCOMPLETE_DATATYPE = {
+    "version": "1.0",
+    "meta": {"name": "incomplete-datatype_spec"},
+    "datatypes": [
+        _make_datatype(
+            "CompleteFrame",
+            "value",
+            description="Frame with all validation components",
+            check_functions=["apps.checks:check_complete"],
+            generator_factory="apps.generators:generate_complete",
+        ),
+        _make_datatype(
+            "IncompleteFrame",
+            "result",
+            description="Frame missing all validation components",
+            # check_functions なし
+            # examples なし
+            # generator_factory なし
+        ),
+    ],
+    "checks": [
+        {
+            "id": "check_complete",
+            "description": "Check for complete frame",
+            "impl": "apps.checks:check_complete",
+            "file_path": "checks/complete.py",
+        }
+    ],
+    "generators": [
+        {
+            "id": "generate_complete",
+            "description": "Generator for complete frame",
+            "impl": "apps.generators:generate_complete",
+            "file_path": "generators/complete.py",
+            "parameters": [],
+            "return_type_ref": "CompleteFrame",
+        }
+    ],
+}
+
+
+# 検証コンポーネントのないDataTypeを複数含むspec
+_SPEC_MULTIPLE_INCOMPLETE = {
+    "version": "1.0",
+    "meta": {"name": "multiple-incomplete_spec"},
+    "datatypes": [
+        _make_datatype(
+            "Frame1",
+            "value",
+            # 検証コンポーネントなし
+        ),
+        _make_datatype(
+            "Frame2",
+            "result",
+            # 検証コンポーネントなし
+        ),
+        _make_datatype(
+            "Frame3",
+            "other",
+            "str",
+            # 検証コンポーネントなし
+        ),
+    ],
+}
+
+
+def test_dag_stage_with_zero_transform_candidates_detected(cached_validate_spec):
     """i/o dtypeに対して候補のtransform関数がゼロ件のdag_stagesが検出されることを確認"""
     spec_data = {
         "version": "1.0",
         "meta": {"name": "zero-candidates_spec"},
         "datatypes": [
-            {
-                "id": "FrameA",
-                "dataframe_schema": {
-                    "index": {"name": "idx", "dtype": "int"},
-                    "columns": [{"name": "value", "dtype": "float"}],
-                },
-            },
-            {
-                "id": "FrameB",
-                "dataframe_schema": {
-                    "index": {"name": "idx", "dtype": "int"},
-                    "columns": [{"name": "result", "dtype": "float"}],
-                },
-            },
-            {
-                "id": "FrameC",
-                "dataframe_schema": {
-                    "index": {"name": "idx", "dtype": "int"},
-                    "columns": [{"name": "other", "dtype": "str"}],
-                },
-            },
+            _make_datatype("FrameA", "value"),
+            _make_datatype("FrameB", "result"),
+            _make_datatype("FrameC", "other", "str"),
         ],
         "transforms": [
             {
@@ -77,11 +215,7 @@ def test_dag_stage_with_zero_transform_candidates_detected(temp_spec_dir):
         ],
     }
 
-    spec_path = temp_spec_dir / "spec.yaml"
-    with open(spec_path, "w") as f:
-        yaml.dump(spec_data, f)
-
-    result = validate_spec(str(spec_path))
+    result = cached_validate_spec(spec_data)
     errors = result["errors"]
 
     # エラーが報告されること
@@ -89,34 +223,18 @@ def test_dag_stage_with_zero_transform_candidates_detected(temp_spec_dir):
     assert total_errors > 0, "DAG stage with zero transform candidates should be detected"
 
     # エラーメッセージに該当するstage_idが含まれること
-    all_error_messages = []
-    for category_errors in errors.values():
-        all_error_messages.extend(category_errors)
-
-    combined_errors = " ".join(all_error_messages).lower()
-    assert (
-        "stage_b_to_c" in combined_errors
-        or "no candidates" in combined_errors
-        or "no transform" in combined_errors
-        or "frameb" in combined_errors
-        and "framec" in combined_errors
-    ), f"Expected error about stage_b_to_c having no candidates, but got: {combined_errors}"
+    messages = _collect_lower(errors)
+    assert _contains_any(messages, "stage_b_to_c", "no candidates", "no transform") or (
+        _contains_any(messages, "frameb") and _contains_any(messages, "framec")
+    ), f"Expected error about stage_b_to_c having no candidates, but got: {messages}"
 
 
-def test_dag_stage_with_explicit_empty_candidates_detected(temp_spec_dir):
+def test_dag_stage_with_explicit_empty_candidates_detected(cached_validate_spec):
     """明示的に空のcandidatesが指定された場合も検出されることを確認"""
     spec_data = {
         "version": "1.0",
         "meta": {"name": "explicit-empty-candidates_spec"},
-        "datatypes": [
-            {
-                "id": "FrameA",
-                "dataframe_schema": {
-                    "index": {"name": "idx", "dtype": "int"},
-                    "columns": [{"name": "value", "dtype": "float"}],
-                },
-            }
-        ],
+        "datatypes": [_make_datatype("FrameA", "value")],
         "transforms": [
             {
                 "id": "transform_a",
@@ -137,11 +255,7 @@ def test_dag_stage_with_explicit_empty_candidates_detected(temp_spec_dir):
         ],
     }
 
-    spec_path = temp_spec_dir / "spec.yaml"
-    with open(spec_path, "w") as f:
-        yaml.dump(spec_data, f)
-
-    result = validate_spec(str(spec_path))
+    result = cached_validate_spec(spec_data)
     errors = result["errors"]
 
     # エラーが報告されること
@@ -149,296 +263,59 @@ def test_dag_stage_with_explicit_empty_candidates_detected(temp_spec_dir):
     assert total_errors > 0, "DAG stage with explicit empty candidates should be detected"
 
 
-def test_datatype_with_zero_check_functions_detected(temp_spec_dir):
-    """dtypeの型アノテーションのcheckがゼロ件の場合が検出されることを確認"""
-    spec_data = {
-        "version": "1.0",
-        "meta": {"name": "zero-checks_spec"},
-        "datatypes": [
-            {
-                "id": "ValidatedFrame",
-                "description": "Frame with checks",
-                "dataframe_schema": {
-                    "index": {"name": "idx", "dtype": "int"},
-                    "columns": [{"name": "value", "dtype": "float"}],
-                },
-                "check_functions": ["apps.checks:check_validated"],  # checkあり
-            },
-            {
-                "id": "UnvalidatedFrame",
-                "description": "Frame without checks",
-                "dataframe_schema": {
-                    "index": {"name": "idx", "dtype": "int"},
-                    "columns": [{"name": "result", "dtype": "float"}],
-                },
-                # check_functionsなし（エラーまたは警告）
-            },
-        ],
-        "checks": [
-            {
-                "id": "check_validated",
-                "description": "Validation check",
-                "impl": "apps.checks:check_validated",
-                "file_path": "checks/validated.py",
-            }
-        ],
-    }
-
-    spec_path = temp_spec_dir / "spec.yaml"
-    with open(spec_path, "w") as f:
-        yaml.dump(spec_data, f)
-
-    result = validate_spec(str(spec_path))
+@pytest.mark.parametrize(
+    ("spec_data", "min_issues", "expected"),
+    [
+        pytest.param(
+            _SPEC_ZERO_CHECKS,
+            1,
+            ("unvalidatedframe", "no check", "missing check"),
+            id="zero_check_functions",
+        ),
+        pytest.param(
+            _SPEC_ZERO_EXAMPLES_GENERATORS,
+            1,
+            ("framewithneither", "no example", "no generator", "missing example"),
+            id="zero_examples_and_zero_generators",
+        ),
+        pytest.param(
+            _SPEC_INCOMPLETE_DATATYPE,
+            1,
+            ("incompleteframe",),
+            id="completeness_all_three_checks",
+        ),
+        # 1つ目で停止せず、すべてのDataTypeが報告されること
+        pytest.param(
+            _SPEC_MULTIPLE_INCOMPLETE,
+            3,
+            ("frame1", "frame2", "frame3"),
+            id="reports_all_incomplete_datatypes",
+        ),
+    ],
+)
+def test_incomplete_datatype_detected(cached_validate_spec, spec_data, min_issues, expected):
+    """検証コンポーネントが欠けたDataTypeがエラーまたは警告として報告されることを確認"""
+    result = cached_validate_spec(spec_data)
     errors = result["errors"]
     warnings = result["warnings"]
 
     # エラーまたは警告が報告されること
     total_issues = sum(len(errs) for errs in errors.values()) + sum(len(warns) for warns in warnings.values())
-    assert total_issues > 0, "DataType with zero check functions should be detected (as warning or error)"
+    assert total_issues >= min_issues, f"Expected at least {min_issues} errors/warnings, but got {total_issues}"
 
     # エラー/警告メッセージに該当するDataType IDが含まれること
-    all_error_messages = []
-    for category_errors in errors.values():
-        all_error_messages.extend(category_errors)
-    for category_warnings in warnings.values():
-        all_error_messages.extend(category_warnings)
-
-    combined_errors = " ".join(all_error_messages).lower()
-    assert (
-        "unvalidatedframe" in combined_errors or "no check" in combined_errors or "missing check" in combined_errors
-    ), f"Expected warning about UnvalidatedFrame having no checks, but got: {combined_errors}"
-
-
-def test_datatype_with_zero_examples_and_zero_generators_detected(temp_spec_dir):
-    """example/generatorの両方がゼロ件の場合が検出されることを確認"""
-    spec_data = {
-        "version": "1.0",
-        "meta": {"name": "zero-examples-generators_spec"},
-        "datatypes": [
-            {
-                "id": "FrameWithExample",
-                "description": "Frame with example",
-                "dataframe_schema": {
-                    "index": {"name": "idx", "dtype": "int"},
-                    "columns": [{"name": "value", "dtype": "float"}],
-                },
-            },
-            {
-                "id": "FrameWithGenerator",
-                "description": "Frame with generator",
-                "dataframe_schema": {
-                    "index": {"name": "idx", "dtype": "int"},
-                    "columns": [{"name": "result", "dtype": "float"}],
-                },
-                "generator_factory": "apps.generators:generate_frame",  # generatorあり
-            },
-            {
-                "id": "FrameWithNeither",
-                "description": "Frame without example or generator",
-                "dataframe_schema": {
-                    "index": {"name": "idx", "dtype": "int"},
-                    "columns": [{"name": "other", "dtype": "str"}],
-                },
-                # exampleもgeneratorもなし（エラーまたは警告）
-            },
-        ],
-        "examples": [
-            {
-                "id": "example_1",
-                "description": "Example for FrameWithExample",
-                "datatype_ref": "FrameWithExample",
-                "input": {"idx": [1], "value": [10.0]},
-            }
-        ],
-        "generators": [
-            {
-                "id": "generate_frame",
-                "description": "Generator for FrameWithGenerator",
-                "impl": "apps.generators:generate_frame",
-                "file_path": "generators/generators.py",
-                "parameters": [],
-                "return_type_ref": "FrameWithGenerator",
-            }
-        ],
-    }
-
-    spec_path = temp_spec_dir / "spec.yaml"
-    with open(spec_path, "w") as f:
-        yaml.dump(spec_data, f)
+    messages = _collect_lower(errors, warnings)
+    assert _contains_any(messages, *expected), f"Expected errors/warnings mentioning {expected}, but got: {messages}"
 
-    result = validate_spec(str(spec_path))
-    errors = result["errors"]
-    warnings = result["warnings"]
-
-    # エラーまたは警告が報告されること
-    total_issues = sum(len(errs) for errs in errors.values()) + sum(len(warns) for warns in warnings.values())
-    assert total_issues > 0, "DataType with neither examples nor generators should be detected (as warning or error)"
 
-    # エラー/警告メッセージに該当するDataType IDが含まれること
-    all_error_messages = []
-    for category_errors in errors.values():
-        all_error_messages.extend(category_errors)
-    for category_warnings in warnings.values():
-        all_error_messages.extend(category_warnings)
-
-    combined_errors = " ".join(all_error_messages).lower()
-    assert (
-        "framewithneither" in combined_errors
-        or "no example" in combined_errors
-        or "no generator" in combined_errors
-        or "missing example" in combined_errors
-    ), f"Expected warning about FrameWithNeither having no examples/generators, but got: {combined_errors}"
-
-
-def test_datatype_completeness_all_three_checks(temp_spec_dir):
-    """check/example/generatorの3つすべてがゼロの場合、最も重大なエラーとして検出されることを確認"""
-    spec_data = {
-        "version": "1.0",
-        "meta": {"name": "incomplete-datatype_spec"},
-        "datatypes": [
-            {
-                "id": "CompleteFrame",
-                "description": "Frame with all validation components",
-                "dataframe_schema": {
-                    "index": {"name": "idx", "dtype": "int"},
-                    "columns": [{"name": "value", "dtype": "float"}],
-                },
-                "check_functions": ["apps.checks:check_complete"],
-                "generator_factory": "apps.generators:generate_complete",
-            },
-            {
-                "id": "IncompleteFrame",
-                "description": "Frame missing all validation components",
-                "dataframe_schema": {
-                    "index": {"name": "idx", "dtype": "int"},
-                    "columns": [{"name": "result", "dtype": "float"}],
-                },
-                # check_functions なし
-                # examples なし
-                # generator_factory なし
-            },
-        ],
-        "checks": [
-            {
-                "id": "check_complete",
-                "description": "Check for complete frame",
-                "impl": "apps.checks:check_complete",
-                "file_path": "checks/complete.py",
-            }
-        ],
-        "generators": [
-            {
-                "id": "generate_complete",
-                "description": "Generator for complete frame",
-                "impl": "apps.generators:generate_complete",
-                "file_path": "generators/complete.py",
-                "parameters": [],
-                "return_type_ref": "CompleteFrame",
-            }
-        ],
-    }
-
-    spec_path = temp_spec_dir / "spec.yaml"
-    with open(spec_path, "w") as f:
-        yaml.dump(spec_data, f)
-
-    result = validate_spec(str(spec_path))
-    errors = result["errors"]
-    warnings = result["warnings"]
-
-    # 複数のエラー/警告が報告されること（check/example/generatorの3つ）
-    total_issues = sum(len(errs) for errs in errors.values()) + sum(len(warns) for warns in warnings.values())
-    assert total_issues >= 1, "DataType missing all validation components should produce multiple errors/warnings"
-
-    # エラー/警告メッセージに該当するDataType IDが含まれること
-    all_error_messages = []
-    for category_errors in errors.values():
-        all_error_messages.extend(category_errors)
-    for category_warnings in warnings.values():
-        all_error_messages.extend(category_warnings)
-
-    combined_errors = " ".join(all_error_messages).lower()
-    assert "incompleteframe" in combined_errors, (
-        f"Expected errors/warnings about IncompleteFrame, but got: {combined_errors}"
-    )
-
-
-def test_validation_reports_all_incomplete_datatypes(temp_spec_dir):
-    """複数のDataTypeに問題がある場合、すべて報告されることを確認（1つ目で停止しない）"""
-    spec_data = {
-        "version": "1.0",
-        "meta": {"name": "multiple-incomplete_spec"},
-        "datatypes": [
-            {
-                "id": "Frame1",
-                "dataframe_schema": {
-                    "index": {"name": "idx", "dtype": "int"},
-                    "columns": [{"name": "value", "dtype": "float"}],
-                },
-                # 検証コンポーネントなし
-            },
-            {
-                "id": "Frame2",
-                "dataframe_schema": {
-                    "index": {"name": "idx", "dtype": "int"},
-                    "columns": [{"name": "result", "dtype": "float"}],
-                },
-                # 検証コンポーネントなし
-            },
-            {
-                "id": "Frame3",
-                "dataframe_schema": {
-                    "index": {"name": "idx", "dtype": "int"},
-                    "columns": [{"name": "other", "dtype": "str"}],
-                },
-                # 検証コンポーネントなし
-            },
-        ],
-    }
-
-    spec_path = temp_spec_dir / "spec.yaml"
-    with open(spec_path, "w") as f:
-        yaml.dump(spec_data, f)
-
-    result = validate_spec(str(spec_path))
-    errors = result["errors"]
-    warnings = result["warnings"]
-
-    # 複数のエラー/警告が報告されること
-    total_issues = sum(len(errs) for errs in errors.values()) + sum(len(warns) for warns in warnings.values())
-    assert total_issues >= 3, "All incomplete DataTypes should be reported, not just the first one"
-
-    # 各DataTypeがエラー/警告メッセージに含まれること
-    all_error_messages = []
-    for category_errors in errors.values():
-        all_error_messages.extend(category_errors)
-    for category_warnings in warnings.values():
-        all_error_messages.extend(category_warnings)
-
-    combined_errors = " ".join(all_error_messages).lower()
-    assert "frame1" in combined_errors or "frame2" in combined_errors or "frame3" in combined_errors
-
-
-def test_dag_stage_zero_candidates_specific_error_message(temp_spec_dir):
+def test_dag_stage_zero_candidates_specific_error_message(cached_validate_spec):
     """候補がゼロのdag_stageのエラーメッセージが具体的であることを確認"""
     spec_data = {
         "version": "1.0",
         "meta": {"name": "specific-error_spec"},
         "datatypes": [
-            {
-                "id": "InputFrame",
-                "dataframe_schema": {
-                    "index": {"name": "idx", "dtype": "int"},
-                    "columns": [{"name": "input", "dtype": "float"}],
-                },
-            },
-            {
-                "id": "OutputFrame",
-                "dataframe_schema": {
-                    "index": {"name": "idx", "dtype": "int"},
-                    "columns": [{"name": "output", "dtype": "float"}],
-                },
-            },
+            _make_datatype("InputFrame", "input"),
+            _make_datatype("OutputFrame", "output"),
         ],
         "transforms": [],  # transformが一つもない
         "dag_stages": [
@@ -451,24 +328,13 @@ def test_dag_stage_zero_candidates_specific_error_message(temp_spec_dir):
         ],
     }
 
-    spec_path = temp_spec_dir / "spec.yaml"
-    with open(spec_path, "w") as f:
-        yaml.dump(spec_data, f)
-
-    result = validate_spec(str(spec_path))
+    result = cached_validate_spec(spec_data)
     errors = result["errors"]
 
     # エラーメッセージに以下の情報が含まれることを確認
     # - stage_id
     # - input_type
     # - output_type
-    all_error_messages = []
-    for category_errors in errors.values():
-        all_error_messages.extend(category_errors)
-
-    combined_errors = " ".join(all_error_messages).lower()
-
-    assert "processing_stage" in combined_errors, "Error should mention the stage_id"
-    assert "inputframe" in combined_errors or "outputframe" in combined_errors, (
-        "Error should mention the input/output types"
-    )
+    messages = _collect_lower(errors)
+    assert _contains_any(messages, "processing_stage"), "Error should mention the stage_id"
+    assert _contains_any(messages, "inputframe", "outputframe"), "Error should mention the input/output types"
@@ -2,18 +2,19 @@
 
 from pathlib import Path
 
-from spectool.spectool.core.engine.loader import load_spec
-from spectool.spectool.core.engine.normalizer import normalize_ir
+from spectool.spectool.core.engine.loader import load_spec_from_str
 from spectool.spectool.core.engine.validate import (
     validate_ir,
+    validate_spec,
+    validate_spec_ir,
 )
 
 
-def test_validate_valid_spec():
+def test_validate_valid_spec(load_fixture_ir):
     """正常なspecのバリデーションが通るテスト（impl参照は除く）"""
     fixture_path = Path(__file__).parent / "fixtures" / "valid_spec.yaml"
-    ir = load_spec(fixture_path)
-    normalized = normalize_ir(ir)
+    ir = load_fixture_ir(fixture_path)
+    normalized = load_fixture_ir(fixture_path, normalize=True)
 
     # impl参照をクリアして構造的な検証のみ行う（実装が存在しないため）
     for check in ir.checks:
@@ -25,20 +26,20 @@ def test_validate_valid_spec():
     assert len(errors) == 0, f"Expected no errors, but got: {errors}"
 
 
-def test_validate_duplicate_columns():
+def test_validate_duplicate_columns(load_fixture_ir):
     """重複列名のエラー検出テスト"""
     fixture_path = Path(__file__).parent / "fixtures" / "invalid_spec_duplicate_cols.yaml"
-    ir = load_spec(fixture_path)
+    ir = load_fixture_ir(fixture_path)
     errors = validate_ir(ir)
 
     assert len(errors) > 0, "Expected errors for duplicate columns"
     assert any("duplicate column" in e.lower() for e in errors), f"Expected duplicate column error, got: {errors}"
 
 
-def test_validate_missing_dtype():
+def test_validate_missing_dtype(load_fixture_ir):
     """dtype未設定のエラー検出テスト"""
     fixture_path = Path(__file__).parent / "fixtures" / "invalid_spec_missing_type.yaml"
-    ir = load_spec(fixture_path)
+    ir = load_fixture_ir(fixture_path)
     errors = validate_ir(ir)
 
     assert len(errors) > 0, "Expected errors for missing dtype"
@@ -236,3 +237,56 @@ def test_validate_native_type_ref():
     errors = validate_ir(ir)
     # native型参照はエラーにならない
     assert len(errors) == 0, f"Expected no errors for native type_ref, got: {errors}"
+
+
+def test_validate_spec_ir_matches_file():
+    """文字列から読み込んだIRの検証結果がファイルからの検証結果と一致するテスト"""
+    fixture_path = Path(__file__).parent / "fixtures" / "invalid_spec_duplicate_cols.yaml"
+
+    from_file = validate_spec(fixture_path, skip_impl_check=True)
+    from_str = validate_spec_ir(load_spec_from_str(fixture_path.read_text()), skip_impl_check=True)
+
+    assert from_str == from_file
+    assert any(from_str["errors"].values()), "Expected errors for duplicate columns"
+
+
+def test_validate_import_cache_is_scoped_to_one_run(tmp_path, monkeypatch):
+    """同じモジュールへの参照はすべて報告され、後から作成されたモジュールは次回の検証で解決されるテスト"""
+    from spectool.spectool.core.base.ir import FrameSpec, MetaSpec, SpecIR
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    ir = SpecIR(
+        meta=MetaSpec(name="test"),
+        frames=[
+            FrameSpec(
+                id=f"Frame{i}",
+                columns=[],
+                check_functions=["late_checks_module:check_ok"],
+            )
+            for i in range(3)
+        ],
+    )
+
+    errors = validate_ir(ir)
+    assert sum("cannot import check_function" in e for e in errors) == 3, f"Expected 3 import errors, got: {errors}"
+
+    (tmp_path / "late_checks_module.py").write_text("def check_ok(df):\n    return True\n")
+    errors = validate_ir(ir)
+    assert not any("cannot import" in e for e in errors), f"Expected no import errors, got: {errors}"
+
+
+def test_validate_same_schema_reported_per_frame():
+    """同じ内容のスキーマを持つ複数のDataFrameで、エラーがそれぞれのIDで報告されるテスト"""
+    from spectool.spectool.core.base.ir import ColumnRule, FrameSpec, MetaSpec, SpecIR
+
+    ir = SpecIR(
+        meta=MetaSpec(name="test"),
+        frames=[
+            FrameSpec(id=frame_id, columns=[ColumnRule(name="col1", dtype="")])
+            for frame_id in ("FirstFrame", "SecondFrame")
+        ],
+    )
+
+    errors = validate_ir(ir)
+    assert "DataFrame 'FirstFrame', column 'col1': dtype is not set" in errors
+    assert "DataFrame 'SecondFrame', column 'col1': dtype is not set" in errors
@@ -16,10 +16,21 @@ from __future__ import annotations
 
 import argparse
 import ast
+import contextlib
+import functools
+import hashlib
+import io
+import itertools
+import os
+import pickle  # noqa: S403 - local parse-tree cache written by this tool
+import sys
+import tempfile
+import tokenize
 from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, Iterator, Literal, Optional, Set
+from typing import Any, Callable, Dict, Iterable, Iterator, Literal, Optional, Set
 
 DEFAULT_IGNORED_SYMBOLS: Set[str] = {
     "spectool.spectool.core.base.meta_types.Check",
@@ -28,8 +39,73 @@ DEFAULT_IGNORED_SYMBOLS: Set[str] = {
     "spectool.spectool.core.base.meta_types.ExampleValue.__class_getitem__",
 }
 
+# Nodes without symbol references below them; _collect_symbol_refs does not descend into these.
+_REF_LEAF_TYPES: frozenset[type[ast.AST]] = frozenset({ast.Constant})
+
+# AST fields that never hold nodes worth walking: identifiers, flags, and the
+# operator / expression-context singletons.
+_NON_CHILD_FIELDS: frozenset[str] = frozenset(
+    {
+        "id",
+        "attr",
+        "name",
+        "arg",
+        "module",
+        "level",
+        "kind",
+        "type_comment",
+        "asname",
+        "conversion",
+        "is_async",
+        "simple",
+        "ctx",
+        "op",
+    }
+)
+_AST_CHILD_FIELDS: Dict[type[ast.AST], tuple[str, ...]] = {}
+
+
+def child_fields(node_type: type[ast.AST]) -> tuple[str, ...]:
+    """Names of the fields of ``node_type`` that can hold child nodes (computed once per type)."""
+    fields = _AST_CHILD_FIELDS.get(node_type)
+    if fields is None:
+        fields = tuple(field for field in node_type._fields if field not in _NON_CHILD_FIELDS)
+        _AST_CHILD_FIELDS[node_type] = fields
+    return fields
+
+
+def push_child_nodes(node: ast.AST, stack: list[ast.AST]) -> None:
+    """Push the direct child nodes of ``node`` onto ``stack``, in field order."""
+    for field in child_fields(type(node)):
+        value = getattr(node, field, None)
+        if type(value) is list:
+            stack.extend(item for item in value if isinstance(item, ast.AST))
+        elif isinstance(value, ast.AST):
+            stack.append(value)
+
+
+# Annotation fields that ModuleAnalyzer already walks with _collect_symbol_refs
+# (same owner, same scope) before visiting the node; generic_visit skips them.
+_VISIT_SKIP_FIELDS: Dict[type[ast.AST], frozenset[str]] = {
+    ast.arg: frozenset({"annotation"}),
+    ast.FunctionDef: frozenset({"returns"}),
+    ast.AsyncFunctionDef: frozenset({"returns"}),
+    ast.AnnAssign: frozenset({"annotation"}),
+}
+_VISIT_CHILD_FIELDS: Dict[type[ast.AST], tuple[str, ...]] = {}
+
+
+def visit_fields(node_type: type[ast.AST]) -> tuple[str, ...]:
+    """Child fields of ``node_type`` that ModuleAnalyzer.generic_visit descends into."""
+    fields = _VISIT_CHILD_FIELDS.get(node_type)
+    if fields is None:
+        skipped = _VISIT_SKIP_FIELDS.get(node_type, frozenset())
+        fields = tuple(field for field in child_fields(node_type) if field not in skipped)
+        _VISIT_CHILD_FIELDS[node_type] = fields
+    return fields
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Definition:
     """Represents a declared symbol."""
 
@@ -41,7 +117,7 @@ class Definition:
     lineno: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AliasTarget:
     """Tracks import targets for alias resolution."""
 
@@ -54,10 +130,27 @@ class CallGraphBuilder:
 
     def __init__(self) -> None:
         self.definitions: Dict[str, Definition] = {}
-        self.edges: Dict[str, Set[str]] = defaultdict(set)
+        # module -> symbols defined in it, so per-module queries need not scan all definitions.
+        self.definitions_by_module: Dict[str, list[str]] = defaultdict(list)
+        # Symbols are interned to integer ids; edges[i] holds the targets of symbols[i].
+        self.symbols: list[str] = []
+        self.symbol_ids: Dict[str, int] = {}
+        self.edges: list[Set[int]] = []
         self.class_methods: Dict[str, Set[str]] = defaultdict(set)
-        self.class_attribute_types: Dict[str, Dict[str, str]] = defaultdict(dict)
+        # (class symbol, attribute) -> type symbol of the attribute
+        self.class_attribute_types: Dict[tuple[str, str], str] = {}
         self.module_exports: Dict[str, Dict[str, str]] = defaultdict(dict)
+        # Adjacency restricted to defined symbols, built by finalize().
+        self.neighbors: list[list[int]] = []
+
+    def intern(self, symbol: str) -> int:
+        symbol_id = self.symbol_ids.get(symbol)
+        if symbol_id is None:
+            symbol_id = len(self.symbols)
+            self.symbol_ids[symbol] = symbol_id
+            self.symbols.append(symbol)
+            self.edges.append(set())
+        return symbol_id
 
     def add_definition(
         self,
@@ -78,11 +171,21 @@ class CallGraphBuilder:
                 filepath=filepath,
                 lineno=lineno,
             )
+            self.definitions_by_module[module].append(symbol)
 
     def add_edge(self, source: str, target: str) -> None:
         if not source or not target or source == target:
             return
-        self.edges[source].add(target)
+        self.edges[self.intern(source)].add(self.intern(target))
+
+    def add_edges(self, source: str, targets: Iterable[str]) -> None:
+        """Add edges from ``source`` to each of ``targets`` with a single set update."""
+        if not source:
+            return
+        intern = self.intern
+        target_ids = [intern(target) for target in targets if target and target != source]
+        if target_ids:
+            self.edges[intern(source)].update(target_ids)
 
     def register_method(self, class_symbol: str, method_symbol: str) -> None:
         self.class_methods[class_symbol].add(method_symbol)
@@ -90,13 +193,14 @@ class CallGraphBuilder:
     def register_class_attribute(self, class_symbol: str, attribute: str, type_symbol: str) -> None:
         if not class_symbol or not attribute or not type_symbol:
             return
-        self.class_attribute_types[class_symbol][attribute] = type_symbol
+        self.class_attribute_types[(class_symbol, attribute)] = type_symbol
 
     def finalize(self) -> None:
         """Add containment edges (class -> method) and re-export edges after parsing."""
+        intern = self.intern
         for class_symbol, methods in self.class_methods.items():
             if methods:
-                self.edges[class_symbol].update(methods)
+                self.edges[intern(class_symbol)].update(intern(method) for method in methods)
 
         # Add edges for re-exported symbols
         # When module A imports symbol from module B and re-exports via __all__,
@@ -105,7 +209,13 @@ class CallGraphBuilder:
             for name, target in exports.items():
                 module_symbol = f"{module}.{name}"
                 # Add edge from module to the actual definition
-                self.edges[module].add(target)
+                self.edges[intern(module)].add(intern(target))
+
+        # Edges to undefined symbols are dropped here once instead of being
+        # checked on every traversal.
+        definitions = self.definitions
+        is_defined = [symbol in definitions for symbol in self.symbols]
+        self.neighbors = [[target for target in targets if is_defined[target]] for targets in self.edges]
 
 
 class ModuleAnalyzer(ast.NodeVisitor):
@@ -123,11 +233,16 @@ class ModuleAnalyzer(ast.NodeVisitor):
         self.module = module_name
 
         self.aliases: Dict[str, AliasTarget] = {}
-        self.scope_stack: list[dict[str, str]] = [dict()]
+        # Names visible in the current scope (innermost binding wins); each
+        # entered scope keeps an undo log that restores the outer bindings on exit.
+        self.scope: dict[str, str] = {}
+        self.scope_undo_stack: list[list[tuple[str, Optional[str]]]] = []
         self.function_stack: list[str] = []
         self.class_stack: list[str] = []
         self.local_types_stack: list[dict[str, str]] = [dict()]
         self.module_all_names: Set[str] = set()
+        # ids of top-level definition nodes already registered by _prefill_module_scope
+        self._prefilled_nodes: Set[int] = set()
 
         self.builder.add_definition(
             module_name,
@@ -155,10 +270,46 @@ class ModuleAnalyzer(ast.NodeVisitor):
         return self.class_stack[-1] if self.class_stack else None
 
     def lookup_symbol(self, name: str) -> Optional[str]:
-        for scope in reversed(self.scope_stack):
-            if name in scope:
-                return scope[name]
-        return None
+        return self.scope.get(name)
+
+    def push_scope(self) -> None:
+        self.scope_undo_stack.append([])
+
+    def pop_scope(self) -> None:
+        scope = self.scope
+        for name, previous in reversed(self.scope_undo_stack.pop()):
+            if previous is None:
+                del scope[name]
+            else:
+                scope[name] = previous
+
+    def bind_symbol(self, name: str, symbol: str) -> None:
+        if self.scope_undo_stack:
+            self.scope_undo_stack[-1].append((name, self.scope.get(name)))
+        self.scope[name] = symbol
+
+    # ------------------------------------------------------------------
+    # Traversal
+    # ------------------------------------------------------------------
+    def visit(self, node: ast.AST) -> None:
+        # Dispatch on the node type through a prebuilt table instead of the
+        # per-node getattr("visit_" + class name) done by ast.NodeVisitor.
+        handler = _VISIT_DISPATCH.get(type(node))
+        if handler is None:
+            self.generic_visit(node)
+        else:
+            handler(self, node)
+
+    def generic_visit(self, node: ast.AST) -> None:
+        visit = self.visit
+        for field in visit_fields(type(node)):
+            value = getattr(node, field, None)
+            if type(value) is list:
+                for item in value:
+                    if isinstance(item, ast.AST):
+                        visit(item)
+            elif isinstance(value, ast.AST):
+                visit(value)
 
     # ------------------------------------------------------------------
     # Import handling
@@ -187,29 +338,21 @@ class ModuleAnalyzer(ast.NodeVisitor):
     # ------------------------------------------------------------------
     def visit_ClassDef(self, node: ast.ClassDef) -> None:
         class_symbol = f"{self.module}.{node.name}"
-        self.builder.add_definition(
-            class_symbol,
-            "class",
-            module=self.module,
-            name=node.name,
-            filepath=self.filepath,
-            lineno=node.lineno,
-        )
-        self.scope_stack[-1][node.name] = class_symbol
+        if id(node) not in self._prefilled_nodes:
+            self._define(class_symbol, "class", node)
 
         # decorators reference
         for decorator in node.decorator_list:
-            for ref in self._collect_symbol_refs(decorator):
-                self.builder.add_edge(self.current_symbol(), ref)
+            self.builder.add_edges(self.current_symbol(), self._collect_symbol_refs(decorator))
 
         self.class_stack.append(class_symbol)
-        self.scope_stack.append(dict())
+        self.push_scope()
         self.local_types_stack.append(dict())
 
         self.generic_visit(node)
 
         self.local_types_stack.pop()
-        self.scope_stack.pop()
+        self.pop_scope()
         self.class_stack.pop()
 
     def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
@@ -228,64 +371,44 @@ class ModuleAnalyzer(ast.NodeVisitor):
             symbol = f"{self.module}.{node.name}"
             kind = "function"
 
-        self.builder.add_definition(
-            symbol,
-            kind,
-            module=self.module,
-            name=node.name,
-            filepath=self.filepath,
-            lineno=node.lineno,
-        )
-        self.scope_stack[-1][node.name] = symbol
+        if id(node) not in self._prefilled_nodes:
+            self._define(symbol, kind, node)
 
-        annotations: list[ast.AST] = []
         args = node.args
-        for arg in getattr(args, "posonlyargs", []):
-            if arg.annotation:
-                annotations.append(arg.annotation)
-        for arg in args.args:
-            if arg.annotation:
-                annotations.append(arg.annotation)
-        for arg in args.kwonlyargs:
-            if arg.annotation:
-                annotations.append(arg.annotation)
-        if args.vararg and args.vararg.annotation:
-            annotations.append(args.vararg.annotation)
-        if args.kwarg and args.kwarg.annotation:
-            annotations.append(args.kwarg.annotation)
+        annotations = [
+            arg.annotation
+            for arg in itertools.chain(args.posonlyargs, args.args, args.kwonlyargs, (args.vararg, args.kwarg))
+            if arg is not None and arg.annotation is not None
+        ]
         if node.returns:
             annotations.append(node.returns)
-
-        for annotation in annotations:
-            for ref in self._collect_symbol_refs(annotation):
-                self.builder.add_edge(symbol, ref)
+        self.builder.add_edges(symbol, self._collect_symbol_refs(*annotations))
 
         for decorator in node.decorator_list:
-            for ref in self._collect_symbol_refs(decorator):
-                self.builder.add_edge(self.current_symbol(), ref)
+            self.builder.add_edges(self.current_symbol(), self._collect_symbol_refs(decorator))
 
         self.function_stack.append(symbol)
-        self.scope_stack.append(dict())
+        self.push_scope()
         self.local_types_stack.append(dict())
 
         self.generic_visit(node)
 
         self.local_types_stack.pop()
-        self.scope_stack.pop()
+        self.pop_scope()
         self.function_stack.pop()
 
     # ------------------------------------------------------------------
     # Calls and symbol references
     # ------------------------------------------------------------------
     def visit_Call(self, node: ast.Call) -> None:
+        owner = self.current_symbol()
         target = self._resolve_callable(node.func)
         if target:
-            self.builder.add_edge(self.current_symbol(), target)
+            self.builder.add_edge(owner, target)
 
-        for child in itertools_chain(node.args, node.keywords):
-            child_value = child.value if isinstance(child, ast.keyword) else child
-            for ref in self._collect_symbol_refs(child_value):
-                self.builder.add_edge(self.current_symbol(), ref)
+        for child in itertools.chain(node.args, node.keywords):
+            child_value = child.value if type(child) is ast.keyword else child
+            self.builder.add_edges(owner, self._collect_symbol_refs(child_value))
 
         self.generic_visit(node)
 
@@ -299,8 +422,7 @@ class ModuleAnalyzer(ast.NodeVisitor):
                 self._assign_target(target, inferred)
         owner = self.current_symbol()
         if node.value:
-            for ref in self._collect_symbol_refs(node.value):
-                self.builder.add_edge(owner, ref)
+            self.builder.add_edges(owner, self._collect_symbol_refs(node.value))
         self.generic_visit(node)
 
     def visit_AnnAssign(self, node: ast.AnnAssign) -> None:
@@ -309,11 +431,9 @@ class ModuleAnalyzer(ast.NodeVisitor):
             self._assign_target(node.target, inferred)
         owner = self.current_symbol()
         if node.value:
-            for ref in self._collect_symbol_refs(node.value):
-                self.builder.add_edge(owner, ref)
+            self.builder.add_edges(owner, self._collect_symbol_refs(node.value))
         if node.annotation:
-            for ref in self._collect_symbol_refs(node.annotation):
-                self.builder.add_edge(owner, ref)
+            self.builder.add_edges(owner, self._collect_symbol_refs(node.annotation))
         self.generic_visit(node)
 
     def visit_AugAssign(self, node: ast.AugAssign) -> None:
@@ -362,7 +482,7 @@ class ModuleAnalyzer(ast.NodeVisitor):
             base = self._resolve_symbol_from_expression(node.value)
             if base:
                 candidate = f"{base}.{node.attr}"
-                class_attr_type = self.builder.class_attribute_types.get(base, {}).get(node.attr)
+                class_attr_type = self.builder.class_attribute_types.get((base, node.attr))
                 return class_attr_type or candidate
         return None
 
@@ -378,7 +498,7 @@ class ModuleAnalyzer(ast.NodeVisitor):
             base_symbol = self._resolve_attribute_base(func.value)
             if base_symbol:
                 candidate = f"{base_symbol}.{func.attr}"
-                class_attr_type = self.builder.class_attribute_types.get(base_symbol, {}).get(func.attr)
+                class_attr_type = self.builder.class_attribute_types.get((base_symbol, func.attr))
                 if class_attr_type and self._is_class_symbol(class_attr_type):
                     return class_attr_type
                 return candidate
@@ -400,52 +520,67 @@ class ModuleAnalyzer(ast.NodeVisitor):
         elif isinstance(node, ast.Attribute):
             owner = self._resolve_attribute_base(node.value)
             if owner:
-                attr_type = self.builder.class_attribute_types.get(owner, {}).get(node.attr)
+                attr_type = self.builder.class_attribute_types.get((owner, node.attr))
                 return attr_type or f"{owner}.{node.attr}"
         return None
 
-    def _collect_symbol_refs(self, node: ast.AST) -> Set[str]:
+    def _collect_symbol_refs(self, *nodes: ast.AST) -> Set[str]:
+        # Iterative walk with a single accumulator: this runs for every call
+        # argument, annotation, decorator and assignment value.  Several roots
+        # (e.g. all annotations of a signature) share one walk.
         refs: Set[str] = set()
-        if isinstance(node, ast.Name):
-            symbol = self.lookup_symbol(node.id)
-            if symbol:
-                refs.add(symbol)
-            else:
-                alias = self.aliases.get(node.id)
-                if alias:
-                    refs.add(alias.target)
-        elif isinstance(node, ast.Attribute):
-            base_symbol = self._resolve_attribute_base(node)
-            if base_symbol:
-                refs.add(base_symbol)
-        for child in ast.iter_child_nodes(node):
-            refs.update(self._collect_symbol_refs(child))
+        stack: list[ast.AST] = list(nodes)
+        while stack:
+            current = stack.pop()
+            if type(current) is ast.Name:
+                symbol = self.lookup_symbol(current.id)
+                if symbol:
+                    refs.add(symbol)
+                else:
+                    alias = self.aliases.get(current.id)
+                    if alias:
+                        refs.add(alias.target)
+                continue
+            node_type = type(current)
+            if node_type is ast.Attribute:
+                base_symbol = self._resolve_attribute_base(current)
+                if base_symbol:
+                    refs.add(base_symbol)
+            elif node_type in _REF_LEAF_TYPES:
+                continue
+            push_child_nodes(current, stack)
         return refs
 
+    def _define(
+        self,
+        symbol: str,
+        kind: Literal["class", "function", "method"],
+        node: ast.ClassDef | ast.FunctionDef | ast.AsyncFunctionDef,
+    ) -> None:
+        self.builder.add_definition(
+            symbol,
+            kind,
+            module=self.module,
+            name=node.name,
+            filepath=self.filepath,
+            lineno=node.lineno,
+        )
+        self.bind_symbol(node.name, symbol)
+
     def _prefill_module_scope(self, tree: ast.Module) -> None:
+        """Register top-level classes and functions up front so forward references resolve.
+
+        The visitor skips re-registering these nodes.
+        """
         for node in tree.body:
             if isinstance(node, ast.ClassDef):
-                symbol = f"{self.module}.{node.name}"
-                self.scope_stack[0][node.name] = symbol
-                self.builder.add_definition(
-                    symbol,
-                    "class",
-                    module=self.module,
-                    name=node.name,
-                    filepath=self.filepath,
-                    lineno=node.lineno,
-                )
+                kind: Literal["class", "function"] = "class"
             elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                symbol = f"{self.module}.{node.name}"
-                self.scope_stack[0][node.name] = symbol
-                self.builder.add_definition(
-                    symbol,
-                    "function",
-                    module=self.module,
-                    name=node.name,
-                    filepath=self.filepath,
-                    lineno=node.lineno,
-                )
+                kind = "function"
+            else:
+                continue
+            self._define(f"{self.module}.{node.name}", kind, node)
+            self._prefilled_nodes.add(id(node))
 
     def _extract_all_names(self, tree: ast.Module) -> None:
         """Extract __all__ definition names."""
@@ -466,6 +601,15 @@ class ModuleAnalyzer(ast.NodeVisitor):
                 self.builder.module_exports[self.module][name] = alias.target
 
 
+# Node type -> handler, built once from the ``visit_<NodeType>`` methods above.
+_VISIT_DISPATCH: Dict[type, Callable[[ModuleAnalyzer, Any], None]] = {
+    getattr(ast, name[len("visit_") :]): handler
+    for name, handler in vars(ModuleAnalyzer).items()
+    if name.startswith("visit_")
+}
+
+
+@functools.lru_cache(maxsize=4096)
 def resolve_relative_module(current_module: str, module: Optional[str], level: int) -> Optional[str]:
     if level == 0:
         return module
@@ -508,15 +652,125 @@ def gather_sources(root: Path, inputs: Iterable[str]) -> dict[str, Path]:
     return module_to_path
 
 
-def build_call_graph(root: Path, modules: dict[str, Path]) -> CallGraphBuilder:
+# Bump when the pickled tree format changes; part of every cache key.
+_TREE_CACHE_FORMAT = 1
+# Least recently used entries beyond this count are pruned after each run.
+_TREE_CACHE_MAX_ENTRIES = 4096
+
+
+def _tree_cache_path(cache_dir: Path, source: bytes) -> Path:
+    """Cache entry for a file's contents; any edit changes the hash and thus the key.
+
+    The interpreter version is part of the key because pickled ASTs are not
+    portable between Python versions.
+    """
+    digest = hashlib.blake2b(f"{_TREE_CACHE_FORMAT}:{sys.version_info[:2]}:".encode(), digest_size=20)
+    digest.update(source)
+    return cache_dir / f"{digest.hexdigest()}.pickle"
+
+
+def _load_cached_tree(cache_file: Path) -> Optional[ast.Module]:
+    try:
+        with cache_file.open("rb") as f:
+            cached = pickle.load(f)  # noqa: S301 - entries are written by this tool only
+    except Exception:  # noqa: BLE001 - missing, truncated or incompatible entries are cache misses
+        return None
+    if not isinstance(cached, ast.Module):
+        return None
+    # Mark the entry as recently used for prune_tree_cache.
+    with contextlib.suppress(OSError):
+        os.utime(cache_file)
+    return cached
+
+
+def _store_cached_tree(cache_file: Path, tree: ast.Module) -> None:
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    # A unique temporary name keeps concurrent writers (--jobs) from clobbering each other.
+    with tempfile.NamedTemporaryFile(dir=cache_file.parent, suffix=".tmp", delete=False) as f:
+        pickle.dump(tree, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(f.name, cache_file)
+
+
+def prune_tree_cache(cache_dir: Path, max_entries: int = _TREE_CACHE_MAX_ENTRIES) -> None:
+    """Remove the least recently used cache entries beyond ``max_entries``."""
+    entries: list[tuple[int, Path]] = []
+    for entry in cache_dir.glob("*.pickle"):
+        with contextlib.suppress(OSError):
+            entries.append((entry.stat().st_mtime_ns, entry))
+    entries.sort(reverse=True)
+    for _, stale in entries[max_entries:]:
+        stale.unlink(missing_ok=True)
+
+
+# AST-only compile without type comments.  PyCF_OPTIMIZED_AST (3.13+) is not used:
+# its constant folding turns ``__all__ = ("a", "b")`` into a single Constant.
+_PARSE_FLAGS: int = ast.PyCF_ONLY_AST
+
+
+def parse_source(file_path: Path, cache_dir: Optional[Path] = None) -> Optional[ast.Module]:
+    """Parse one source file in the encoding it declares (PEP 263; UTF-8 by default).
+
+    Returns None for files whose bytes cannot be decoded in that encoding.
+
+    When ``cache_dir`` is given, parsed trees are pickled there and reused on
+    later runs while the file is unchanged.
+    """
+    # Hand the raw bytes to the parser; decoding to str first only for the
+    # tokenizer to re-encode it doubles the work per file.
+    source = file_path.read_bytes()
+    cache_file = _tree_cache_path(cache_dir, source) if cache_dir is not None else None
+    if cache_file is not None:
+        cached = _load_cached_tree(cache_file)
+        if cached is not None:
+            return cached
+
+    try:
+        tree: ast.Module = compile(source, str(file_path), "exec", _PARSE_FLAGS, dont_inherit=True)
+    except SyntaxError:
+        try:
+            encoding, _ = tokenize.detect_encoding(io.BytesIO(source).readline)
+            source.decode(encoding)
+        except (SyntaxError, LookupError, UnicodeDecodeError):
+            return None
+        raise
+
+    if cache_file is not None:
+        _store_cached_tree(cache_file, tree)
+    return tree
+
+
+def parse_modules(
+    modules: dict[str, Path], jobs: int = 1, cache_dir: Optional[Path] = None
+) -> list[Optional[ast.Module]]:
+    """Parse all modules, in the order of ``modules``.
+
+    With ``jobs > 1`` the files are parsed in worker processes.  Trees have to be
+    pickled back to the main process, so this only pays off for large inputs.
+    """
+    paths = list(modules.values())
+    parse = functools.partial(parse_source, cache_dir=cache_dir)
+    if jobs <= 1:
+        trees = [parse(path) for path in paths]
+    else:
+        chunksize = max(1, len(paths) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            trees = list(executor.map(parse, paths, chunksize=chunksize))
+    if cache_dir is not None:
+        prune_tree_cache(cache_dir)
+    return trees
+
+
+def build_call_graph(
+    root: Path, modules: dict[str, Path], jobs: int = 1, cache_dir: Optional[Path] = None
+) -> CallGraphBuilder:
     builder = CallGraphBuilder()
     analyzers = []
-    for module_name, file_path in modules.items():
-        try:
-            source = file_path.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
+    # Analysis stays sequential: it mutates the shared builder and resolves
+    # class symbols defined by previously visited modules.
+    trees = parse_modules(modules, jobs, cache_dir)
+    for (module_name, file_path), tree in zip(modules.items(), trees, strict=True):
+        if tree is None:
             continue
-        tree = ast.parse(source, filename=str(file_path))
         analyzer = ModuleAnalyzer(builder, file_path, module_name, tree)
         analyzer.visit(tree)
         analyzers.append(analyzer)
@@ -530,16 +784,28 @@ def build_call_graph(root: Path, modules: dict[str, Path]) -> CallGraphBuilder:
 
 
 def compute_reachable(builder: CallGraphBuilder, entries: Iterable[str]) -> Set[str]:
+    # Only defined symbols are followed; entries are reported even when undefined.
     reachable: Set[str] = set()
-    queue: deque[str] = deque(entries)
+    neighbors = builder.neighbors
+    visited = bytearray(len(neighbors))
+    queue: deque[int] = deque()
+    for entry in entries:
+        entry_id = builder.symbol_ids.get(entry)
+        if entry_id is None:
+            reachable.add(entry)
+        else:
+            queue.append(entry_id)
+
     while queue:
-        symbol = queue.popleft()
-        if symbol in reachable:
+        symbol_id = queue.popleft()
+        if visited[symbol_id]:
             continue
-        reachable.add(symbol)
-        for target in builder.edges.get(symbol, ()):
-            if target not in reachable and target in builder.definitions:
-                queue.append(target)
+        visited[symbol_id] = 1
+        for target_id in neighbors[symbol_id]:
+            if not visited[target_id]:
+                queue.append(target_id)
+
+    reachable.update(symbol for symbol, flag in zip(builder.symbols, visited, strict=True) if flag)
     return reachable
 
 
@@ -548,7 +814,7 @@ def format_definition(defn: Definition) -> str:
 
 
 def main() -> None:
-    parser = argparse.ArgumentParser(description=__doc__)
+    parser = argparse.ArgumentParser(description=sys.modules[__name__].__doc__)
     parser.add_argument(
         "--root",
         default=".",
@@ -592,6 +858,18 @@ def main() -> None:
         action="store_true",
         help="Do not skip the built-in ignore list for known dynamic entry points.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes used to parse sources (default: 1, parse in-process).",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Directory for cached parse trees, keyed by file content (default: no cache).",
+    )
     args = parser.parse_args()
 
     root = Path(args.root).resolve()
@@ -599,7 +877,7 @@ def main() -> None:
     if not modules:
         raise SystemExit("No Python sources found under the provided inputs.")
 
-    builder = build_call_graph(root, modules)
+    builder = build_call_graph(root, modules, jobs=args.jobs, cache_dir=args.cache_dir)
     for entry in args.entry:
         if entry not in builder.definitions:
             print(f"Warning: entry symbol '{entry}' is not defined in sources.")
@@ -610,19 +888,17 @@ def main() -> None:
     if not args.no_default_ignore:
         ignored_symbols.update(DEFAULT_IGNORED_SYMBOLS)
 
-    def should_ignore(defn: Definition) -> bool:
-        """動的参照により静的解析不可能なシンボルを除外"""
+    # 動的参照により静的解析不可能なモジュールのシンボルを除外
+    dynamic_modules = (
         # meta_types モジュールは文字列ベースのコード生成で参照されるため除外
-        if defn.module == "spectool.spectool.core.base.meta_types":
-            return True
+        "spectool.spectool.core.base.meta_types",
         # normalizer モジュールはレジストリ経由の動的ディスパッチで参照されるため除外
-        if defn.module == "spectool.spectool.core.engine.normalizer":
-            return True
+        "spectool.spectool.core.engine.normalizer",
         # validate_formatter モジュールは validate.py 経由で __all__ re-export されているが
         # 静的解析では re-export を完全に追跡できないため除外
-        if defn.module == "spectool.spectool.core.engine.validate_formatter":
-            return True
-        return False
+        "spectool.spectool.core.engine.validate_formatter",
+    )
+    dynamic_symbols = {symbol for module in dynamic_modules for symbol in builder.definitions_by_module.get(module, ())}
 
     unreachable_defs = [
         defn
@@ -630,7 +906,7 @@ def main() -> None:
         if defn.kind in args.include_kinds
         and defn.symbol not in reachable
         and defn.symbol not in ignored_symbols
-        and not should_ignore(defn)
+        and defn.symbol not in dynamic_symbols
     ]
     unreachable_defs.sort(key=lambda d: (str(d.filepath), d.lineno, d.symbol))
 
@@ -639,16 +915,9 @@ def main() -> None:
         print("All tracked symbols are reachable from the provided entry points.")
         return
     print("== Unreachable symbols ==")
-    for defn in unreachable_defs:
-        print(format_definition(defn))
+    sys.stdout.writelines(f"{format_definition(defn)}\n" for defn in unreachable_defs)
     raise SystemExit(1)
 
 
-def itertools_chain(*iterables: Iterable[ast.AST]) -> Iterator[ast.AST]:
-    for iterable in iterables:
-        for item in iterable:
-            yield item
-
-
 if __name__ == "__main__":
     main()